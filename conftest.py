@@ -0,0 +1,44 @@
+# conftest.py
+"""
+pytest 会话级共享夹具
+管理器和投资组合系统在整个测试会话中只创建一次，供 test_fixes.py、test_improvements.py 等测试共用
+（直接以脚本方式运行时，由各脚本的 main() 通过 testing_support 创建并传入）
+"""
+
+import sys
+import os
+import pytest
+
+# 添加项目路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+import testing_support
+
+@pytest.fixture(scope="session")
+def fundamental_manager():
+    """基本面分析管理器"""
+    return testing_support.new_fundamental_manager()
+
+@pytest.fixture(scope="session")
+def technical_manager():
+    """技术分析管理器"""
+    return testing_support.new_technical_manager()
+
+@pytest.fixture(scope="session")
+def streamlit_module():
+    """streamlit 模块（未安装时跳过相关测试）"""
+    return pytest.importorskip("streamlit")
+
+@pytest.fixture(scope="session")
+def portfolio_system():
+    """完整投资组合系统（依赖streamlit，未安装时跳过相关测试）"""
+    pytest.importorskip("streamlit")
+    return testing_support.new_portfolio_system()
+
+@pytest.fixture
+def fresh_portfolio_system():
+    """每个测试单独创建的投资组合系统，供会修改系统状态的测试使用，避免影响共享实例"""
+    pytest.importorskip("streamlit")
+    return testing_support.new_portfolio_system()
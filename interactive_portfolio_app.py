@@ -737,6 +737,7 @@ class CompletePortfolioSystem:
             # 标准化技术分析数据格式
             if hasattr(self, 'technical_manager') and hasattr(self.technical_manager, 'all_signals'):
                 if isinstance(self.technical_manager.all_signals, dict):
+                    signals_changed = False
                     for asset_class, signals in self.technical_manager.all_signals.items():
                         if isinstance(signals, dict):
                             for ticker, signal_data in signals.items():
@@ -746,6 +747,10 @@ class CompletePortfolioSystem:
                                     for field in required_fields:
                                         if field not in signal_data:
                                             signal_data[field] = 'N/A'
+                                            signals_changed = True
+                    # 原地补充了信号字段，使管理器缓存的信号表和报告失效
+                    if signals_changed:
+                        self.technical_manager.invalidate_caches()
             
             return True
         except Exception as e:
@@ -8,7 +8,6 @@
 
 import pandas as pd
 import numpy as np
-import yfinance as yf
 from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
@@ -18,6 +17,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from technical_indicators import (
+    download_price_data,
     calculate_sma, calculate_ema, calculate_rsi, calculate_macd,
     calculate_bollinger_bands, calculate_atr
 )
@@ -71,7 +71,7 @@ class BondTechnicalStrategy:
         data = {}
         for ticker in tickers:
             try:
-                bond_data = yf.download(ticker, start=start_date, end=end_date, progress=False)
+                bond_data = download_price_data(ticker, start_date, end_date)
                 if not bond_data.empty:
                     data[ticker] = bond_data
             except Exception as e:
@@ -91,6 +91,8 @@ class BondTechnicalStrategy:
             high = bond_data['High']
             low = bond_data['Low']
             volume = bond_data['Volume']
+            macd_line, macd_signal, _ = calculate_macd(close)
+            bb_upper, bb_middle, bb_lower = calculate_bollinger_bands(close)
             
             # 计算技术指标
             indicators[ticker] = {
@@ -103,11 +105,11 @@ class BondTechnicalStrategy:
                 'ema_12': calculate_ema(close, 12),
                 'ema_26': calculate_ema(close, 26),
                 'rsi': calculate_rsi(close, 14),
-                'macd_line': calculate_macd(close)[0],
-                'macd_signal': calculate_macd(close)[1],
-                'bb_upper': calculate_bollinger_bands(close)[0],
-                'bb_middle': calculate_bollinger_bands(close)[1],
-                'bb_lower': calculate_bollinger_bands(close)[2],
+                'macd_line': macd_line,
+                'macd_signal': macd_signal,
+                'bb_upper': bb_upper,
+                'bb_middle': bb_middle,
+                'bb_lower': bb_lower,
                 'atr': calculate_atr(high, low, close, 14),
                 'volatility': close.pct_change().rolling(20).std() * np.sqrt(252)
             }
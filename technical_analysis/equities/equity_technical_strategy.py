@@ -8,7 +8,6 @@
 
 import pandas as pd
 import numpy as np
-import yfinance as yf
 from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
@@ -18,6 +17,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from technical_indicators import (
+    download_price_data,
     calculate_sma, calculate_ema, calculate_rsi, calculate_macd,
     calculate_bollinger_bands, calculate_atr, calculate_volume_sma
 )
@@ -59,7 +59,7 @@ class EquityTechnicalStrategy:
             successful_loads = 0
             for ticker in tickers:
                 try:
-                    stock_data = yf.download(ticker, start=start_date, end=end_date, progress=False)
+                    stock_data = download_price_data(ticker, start_date, end_date)
                     if not stock_data.empty and len(stock_data) >= 50:  # 确保有足够的数据
                         data[ticker] = stock_data
                         successful_loads += 1
@@ -96,6 +96,8 @@ class EquityTechnicalStrategy:
             
             # 计算技术指标
             try:
+                macd_line, macd_signal, _ = calculate_macd(close)
+                bb_upper, bb_middle, bb_lower = calculate_bollinger_bands(close)
                 indicators[ticker] = {
                     'close': close,
                     'high': high,
@@ -106,11 +108,11 @@ class EquityTechnicalStrategy:
                     'ema_12': calculate_ema(close, 12),
                     'ema_26': calculate_ema(close, 26),
                     'rsi': calculate_rsi(close, 14),
-                    'macd_line': calculate_macd(close)[0],
-                    'macd_signal': calculate_macd(close)[1],
-                    'bb_upper': calculate_bollinger_bands(close)[0],
-                    'bb_middle': calculate_bollinger_bands(close)[1],
-                    'bb_lower': calculate_bollinger_bands(close)[2],
+                    'macd_line': macd_line,
+                    'macd_signal': macd_signal,
+                    'bb_upper': bb_upper,
+                    'bb_middle': bb_middle,
+                    'bb_lower': bb_lower,
                     'atr': calculate_atr(high, low, close, 14),
                     'volume_sma': calculate_volume_sma(volume, 20)
                 }
@@ -8,8 +8,10 @@
 
 import pandas as pd
 import numpy as np
-import yfinance as yf
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+import glob
+import time
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -18,10 +20,14 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from technical_indicators import (
+    download_price_data,
     calculate_sma, calculate_ema, calculate_rsi, calculate_macd,
     calculate_bollinger_bands, calculate_atr, calculate_fibonacci_retracements
 )
 
+# 斐波那契回撤位的键顺序，与 calculate_fibonacci_retracements 的返回一致
+FIB_LEVEL_KEYS = ('0.0', '0.236', '0.382', '0.5', '0.618', '0.786', '1.0')
+
 class GoldTechnicalStrategy:
     """黄金技术分析策略"""
     
@@ -71,7 +77,7 @@ class GoldTechnicalStrategy:
         data = {}
         for ticker in tickers:
             try:
-                gold_data = yf.download(ticker, start=start_date, end=end_date, progress=False)
+                gold_data = download_price_data(ticker, start_date, end_date)
                 if not gold_data.empty:
                     data[ticker] = gold_data
             except Exception as e:
@@ -81,48 +87,57 @@ class GoldTechnicalStrategy:
     
     def calculate_gold_indicators(self, data):
         """计算黄金技术指标"""
-        indicators = {}
+        # 各标的指标计算互不依赖，且主要在pandas/numpy的C实现中运行（释放GIL），使用线程池并行
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(self._one_ticker_indicators, data.items())
         
-        for ticker, gold_data in data.items():
-            if gold_data.empty:
-                continue
-                
-            close = gold_data['Close']
-            high = gold_data['High']
-            low = gold_data['Low']
-            volume = gold_data['Volume']
-            
-            # 计算技术指标
-            indicators[ticker] = {
-                'close': close,
-                'high': high,
-                'low': low,
-                'volume': volume,
-                'sma_20': calculate_sma(close, 20),
-                'sma_50': calculate_sma(close, 50),
-                'sma_200': calculate_sma(close, 200),
-                'ema_12': calculate_ema(close, 12),
-                'ema_26': calculate_ema(close, 26),
-                'rsi': calculate_rsi(close, 14),
-                'macd_line': calculate_macd(close)[0],
-                'macd_signal': calculate_macd(close)[1],
-                'bb_upper': calculate_bollinger_bands(close)[0],
-                'bb_middle': calculate_bollinger_bands(close)[1],
-                'bb_lower': calculate_bollinger_bands(close)[2],
-                'atr': calculate_atr(high, low, close, 14),
-                'volatility': close.pct_change().rolling(20).std() * np.sqrt(252),
-                'momentum_10': close.pct_change(10),
-                'momentum_20': close.pct_change(20)
-            }
+        indicators = {ticker: ind for ticker, ind in results if ind is not None}
+        return indicators
+    
+    def _one_ticker_indicators(self, item):
+        """计算单个黄金ETF的技术指标，返回 (ticker, 指标字典)，数据为空时指标为None"""
+        ticker, gold_data = item
+        if gold_data.empty:
+            return ticker, None
             
-            # 计算斐波那契回撤位
-            if len(close) > 0:
-                recent_high = high.rolling(50).max().iloc[-1]
-                recent_low = low.rolling(50).min().iloc[-1]
-                fib_levels = calculate_fibonacci_retracements(recent_high, recent_low)
-                indicators[ticker]['fib_levels'] = fib_levels
+        close = gold_data['Close']
+        high = gold_data['High']
+        low = gold_data['Low']
+        volume = gold_data['Volume']
+        macd_line, macd_signal, _ = calculate_macd(close)
+        bb_upper, bb_middle, bb_lower = calculate_bollinger_bands(close)
         
-        return indicators
+        # 计算技术指标
+        ticker_indicators = {
+            'close': close,
+            'high': high,
+            'low': low,
+            'volume': volume,
+            'sma_20': calculate_sma(close, 20),
+            'sma_50': calculate_sma(close, 50),
+            'sma_200': calculate_sma(close, 200),
+            'ema_12': calculate_ema(close, 12),
+            'ema_26': calculate_ema(close, 26),
+            'rsi': calculate_rsi(close, 14),
+            'macd_line': macd_line,
+            'macd_signal': macd_signal,
+            'bb_upper': bb_upper,
+            'bb_middle': bb_middle,
+            'bb_lower': bb_lower,
+            'atr': calculate_atr(high, low, close, 14),
+            'volatility': close.pct_change().rolling(20).std() * np.sqrt(252),
+            'momentum_10': close.pct_change(10),
+            'momentum_20': close.pct_change(20)
+        }
+        
+        # 计算斐波那契回撤位
+        if len(close) > 0:
+            recent_high = high.rolling(50).max().iloc[-1]
+            recent_low = low.rolling(50).min().iloc[-1]
+            fib_levels = calculate_fibonacci_retracements(recent_high, recent_low)
+            ticker_indicators['fib_levels'] = fib_levels
+        
+        return ticker, ticker_indicators
     
     def technical_breakout_strategy(self, indicators):
         """技术突破策略"""
@@ -184,32 +199,48 @@ class GoldTechnicalStrategy:
         """斐波那契回撤策略"""
         signals = {}
         
+        # 收集满足条件的标的，按标的堆叠为数组后统一比较
+        tickers = []
+        fib_rows = []
+        prices = []
+        rsis = []
+        atrs = []
         for ticker, ind in indicators.items():
             if len(ind['close']) < 50:
                 continue
-                
-            current_price = ind['close'].iloc[-1]
-            fib_levels = ind.get('fib_levels', {})
-            rsi = ind['rsi'].iloc[-1]
-            atr = ind['atr'].iloc[-1]
             
+            fib_levels = ind.get('fib_levels', {})
             if not fib_levels:
                 continue
             
-            # 检查是否在关键斐波那契水平附近
-            fib_382 = fib_levels.get('0.382', 0)
-            fib_618 = fib_levels.get('0.618', 0)
-            fib_786 = fib_levels.get('0.786', 0)
-            
-            # 支撑位买入信号
-            support_buy = (abs(current_price - fib_382) / current_price < 0.02 or
-                          abs(current_price - fib_618) / current_price < 0.02) and rsi < 40
-            
-            # 阻力位卖出信号
-            resistance_sell = (abs(current_price - fib_786) / current_price < 0.02) and rsi > 60
-            
-            if support_buy:
-                signals[ticker] = {
+            tickers.append(ticker)
+            fib_rows.append([fib_levels.get(level, 0) for level in FIB_LEVEL_KEYS])
+            prices.append(ind['close'].iloc[-1])
+            rsis.append(ind['rsi'].iloc[-1])
+            atrs.append(ind['atr'].iloc[-1])
+        
+        if not tickers:
+            return signals
+        
+        fib_matrix = np.array(fib_rows, dtype=float)  # (N, 7)
+        prices = np.array(prices, dtype=float)
+        rsis = np.array(rsis, dtype=float)
+        atrs = np.array(atrs, dtype=float)
+        
+        # 检查是否在关键斐波那契水平附近（价格偏离2%以内）
+        with np.errstate(divide='ignore', invalid='ignore'):
+            near = np.abs(fib_matrix - prices[:, None]) / prices[:, None] < 0.02
+        
+        # 支撑位买入信号：0.382 或 0.618 附近且RSI超卖
+        support_mask = (near[:, 2] | near[:, 4]) & (rsis < 40)
+        # 阻力位卖出信号：0.786 附近且RSI超买
+        resistance_mask = near[:, 5] & (rsis > 60)
+        
+        for i in np.flatnonzero(support_mask | resistance_mask):
+            current_price = prices[i]
+            atr = atrs[i]
+            if support_mask[i]:
+                signals[tickers[i]] = {
                     'strategy': 'fibonacci_support',
                     'signal': 'BUY',
                     'strength': 1,
@@ -219,8 +250,8 @@ class GoldTechnicalStrategy:
                     'confidence': 0.6,
                     'reason': '斐波那契支撑位，RSI超卖'
                 }
-            elif resistance_sell:
-                signals[ticker] = {
+            else:
+                signals[tickers[i]] = {
                     'strategy': 'fibonacci_resistance',
                     'signal': 'SELL',
                     'strength': 1,
@@ -388,9 +419,22 @@ class GoldTechnicalStrategy:
         
         return filename
 
-def run_gold_technical_analysis():
-    """运行黄金技术分析"""
+def run_gold_technical_analysis(max_age_hours=24):
+    """
+    运行黄金技术分析
+    
+    Args:
+        max_age_hours: 已保存信号文件的有效时长（小时），未过期时直接加载，不重新下载数据
+    """
     strategy = GoldTechnicalStrategy()
+    
+    # 策略按周调仓，近期已生成的信号无需重新下载计算
+    latest = max(glob.glob("tickers/gold_technical_signals_*.csv"), key=os.path.getmtime, default=None)
+    if latest and time.time() - os.path.getmtime(latest) < max_age_hours * 3600:
+        print(f"📄 使用缓存的交易信号：{latest}")
+        strategy.signals = pd.read_csv(latest).set_index('ticker').to_dict('index')
+        return strategy
+    
     signals = strategy.generate_trading_signals()
     
     if signals:
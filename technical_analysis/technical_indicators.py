@@ -7,9 +7,30 @@
 import pandas as pd
 import numpy as np
 from typing import Union, Optional
+import threading
 import warnings
 warnings.filterwarnings('ignore')
 
+# yf.download 通过 yfinance 模块级的全局状态（shared._DFS / shared._ERRORS）收集结果，
+# 多线程同时调用会互相清空或串用数据；各资产类别策略并行运行时，所有下载都经过这把锁串行执行
+_YF_DOWNLOAD_LOCK = threading.Lock()
+
+def download_price_data(ticker: str, start, end) -> pd.DataFrame:
+    """
+    下载单个标的的历史行情（线程安全）
+    
+    Args:
+        ticker: 标的代码
+        start: 开始日期
+        end: 结束日期
+    
+    Returns:
+        yf.download 返回的行情DataFrame
+    """
+    import yfinance as yf
+    with _YF_DOWNLOAD_LOCK:
+        return yf.download(ticker, start=start, end=end, progress=False)
+
 def calculate_sma(data: pd.Series, window: int) -> pd.Series:
     """
     计算简单移动平均线 (Simple Moving Average)
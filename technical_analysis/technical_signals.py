@@ -7,22 +7,166 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import importlib
+import copy
+import json
 import warnings
 warnings.filterwarnings('ignore')
 
-# 导入各个资产类别的策略
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 各个资产类别的策略在 _run_analysis 中按需导入（见 _STRATEGIES）
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-try:
-    from equities.equity_technical_strategy import EquityTechnicalStrategy
-    from bonds.bond_technical_strategy import BondTechnicalStrategy
-    from commodities.commodity_technical_strategy import CommodityTechnicalStrategy
-    from golds.gold_technical_strategy import GoldTechnicalStrategy
-    print("✅ 所有技术策略模块导入成功")
-except ImportError as e:
-    print(f"⚠️ 导入策略模块失败：{e}")
+# 各资产类别的技术分析策略，模块在运行分析时按需导入
+_STRATEGIES = {
+    'equities': {
+        'module': 'equities.equity_technical_strategy',
+        'class': 'EquityTechnicalStrategy',
+        'attr': 'equity_strategy',
+        'name': '股票',
+        'watch_fallback': True  # 无信号或失败时生成观望建议
+    },
+    'bonds': {
+        'module': 'bonds.bond_technical_strategy',
+        'class': 'BondTechnicalStrategy',
+        'attr': 'bond_strategy',
+        'name': '债券',
+        'watch_fallback': False
+    },
+    'commodities': {
+        'module': 'commodities.commodity_technical_strategy',
+        'class': 'CommodityTechnicalStrategy',
+        'attr': 'commodity_strategy',
+        'name': '大宗商品',
+        'watch_fallback': False
+    },
+    'golds': {
+        'module': 'golds.gold_technical_strategy',
+        'class': 'GoldTechnicalStrategy',
+        'attr': 'gold_strategy',
+        'name': '黄金',
+        'watch_fallback': False
+    }
+}
+
+# 信号类型与资产类别取值固定且很少，DataFrame中使用Categorical存储
+SIGNAL_TYPES = ('BUY', 'SELL', 'HOLD', 'WATCH', 'UNKNOWN')
+ASSET_CLASSES = tuple(_STRATEGIES)
+
+def _to_categorical(values, categories):
+    """转换为Categorical，固定类别在前，数据中出现的其他取值追加在后（不会被置为NaN）"""
+    values = pd.Series(values, dtype=object)
+    extra = [v for v in values.dropna().unique() if v not in categories]
+    return pd.Categorical(values, categories=list(categories) + extra)
+
+# 观望信号模板（实际价格需要从数据获取）
+_WATCH_TEMPLATE = MappingProxyType({
+    'strategy': 'technical_watch',
+    'signal': 'WATCH',
+    'strength': 1,
+    'price': 0,
+    'stop_loss': 0,
+    'target': 0,
+    'confidence': 0.3,
+    'recommendation': '建议观望，一周内买入'
+})
+
+# 各资产类别生成观望建议的标的
+_WATCH_TICKERS = {
+    'equities': ('AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'NVDA', 'META', 'NFLX', 'JPM', 'JNJ', 'V', 'PG', 'UNH', 'HD', 'MA'),
+    'bonds': ('TLT', 'IEF', 'SHY', 'AGG', 'BND', 'VCIT', 'VCSH', 'LQD', 'HYG', 'JNK', 'BNDX', 'VWOB', 'EMB', 'PCY', 'LEMB'),
+    'commodities': ('DIA', 'SPY', 'QQQ', 'IWM', 'GLD', 'SLV', 'USO', 'UNG', 'DBA', 'DBC', 'XLE', 'XLF', 'XLK', 'XLV', 'XLI'),
+    'golds': ('GLD', 'IAU', 'SGOL', 'GLDM', 'BAR', 'OUNZ', 'GLTR', 'AAAU', 'GLDE', 'BGLD', 'XAUUSD=X', 'GC=F')
+}
+
+def _dumps_json(value, indent=True):
+    """序列化为JSON字符串，优先使用orjson（可直接处理numpy类型），否则使用标准库json"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(value, option=option, default=str).decode('utf-8')
+    return json.dumps(value, ensure_ascii=False, indent=2 if indent else None, default=str)
+
+def _normalize_signals(signals):
+    """
+    将信号统一为 {ticker: {字段: 值}} 字典格式
+    
+    写入 all_signals 时调用一次，读取方法只需判断 `if signals:`；
+    信号内容保持原样（缺少 strength 的信号由读取方法自行处理，validate_signals 才能如实报告覆盖情况）
+    """
+    if signals is None:
+        return {}
+    if isinstance(signals, pd.DataFrame):
+        if signals.empty:
+            return {}
+        if 'ticker' in signals.columns:
+            signals = signals.set_index('ticker')
+        signals = signals.to_dict('index')
+    return signals
+
+class _SignalStore(dict):
+    """
+    all_signals 使用的字典 {asset_class: {ticker: signal}}
+    
+    按资产类别写入或删除时统一信号格式，并通知管理器使缓存失效
+    """
+    
+    def __init__(self, on_change, signals=()):
+        super().__init__()
+        self._on_change = on_change
+        self.update(signals)
+    
+    def __setitem__(self, asset_class, signals):
+        super().__setitem__(asset_class, _normalize_signals(signals))
+        self._on_change()
+    
+    def __delitem__(self, asset_class):
+        super().__delitem__(asset_class)
+        self._on_change()
+    
+    def update(self, *args, **kwargs):
+        for asset_class, signals in dict(*args, **kwargs).items():
+            super().__setitem__(asset_class, _normalize_signals(signals))
+        self._on_change()
+    
+    def setdefault(self, asset_class, default=None):
+        if asset_class not in self:
+            self[asset_class] = default
+        return super().__getitem__(asset_class)
+    
+    def pop(self, *args):
+        signals = super().pop(*args)
+        self._on_change()
+        return signals
+    
+    def popitem(self):
+        item = super().popitem()
+        self._on_change()
+        return item
+    
+    def clear(self):
+        super().clear()
+        self._on_change()
+    
+    def __ior__(self, other):
+        self.update(other)
+        return self
+    
+    def __reduce__(self):
+        # 复制/序列化时按普通字典处理，不携带管理器回调
+        return dict, (dict(self),)
 
 class TechnicalAnalysisManager:
     """技术分析管理器"""
@@ -33,116 +177,116 @@ class TechnicalAnalysisManager:
         self.bond_strategy = None
         self.commodity_strategy = None
         self.gold_strategy = None
+        # 信号版本号：信号或分析状态每次更新都会递增，用于使缓存的报告失效
+        self._signals_version = 0
+        self._report_cache = None
+        self._signals_df_cache = None
+        self._top_signals_cache = lru_cache(maxsize=8)(self._compute_top_signals)
         self.all_signals = {}
         self.analysis_status = {}
+        # 各资产类别分析并行运行，写入共享结果时加锁
+        self._lock = threading.Lock()
+    
+    @property
+    def all_signals(self):
+        """所有资产类别的信号 {asset_class: {ticker: signal}}，按资产类别写入同样会使缓存失效"""
+        return self._all_signals
+    
+    @all_signals.setter
+    def all_signals(self, value):
+        # 整体替换信号时同样统一格式，并使缓存失效
+        self._all_signals = _SignalStore(self._bump_signals_version, value)
+    
+    def _bump_signals_version(self):
+        """信号更新后递增版本号，使缓存的报告和DataFrame失效"""
+        self._signals_version += 1
+    
+    def invalidate_caches(self):
+        """
+        使缓存的 signals_df、最强信号和综合报告失效
         
-    def run_equity_analysis(self):
-        """运行股票技术分析"""
-        print("🚀 开始股票技术分析...")
+        原地修改单个信号字典（如 all_signals['equities']['AAPL']['signal'] = ...）不会被自动感知，
+        修改后需要调用此方法
+        """
+        with self._lock:
+            self._bump_signals_version()
+    
+    def _record_result(self, asset_class, status, signals=None):
+        """记录某个资产类别的分析状态和信号，并递增信号版本号"""
+        with self._lock:
+            if signals is not None:
+                self._all_signals[asset_class] = signals
+            self.analysis_status[asset_class] = status
+            self._signals_version += 1
+        
+    def _run_analysis(self, asset_class):
+        """
+        运行单个资产类别的技术分析
+        
+        Args:
+            asset_class: 资产类别，_STRATEGIES 中的键
+        
+        Returns:
+            是否成功生成信号（或观望建议）
+        """
+        config = _STRATEGIES[asset_class]
+        name = config['name']
+        print(f"🚀 开始{name}技术分析...")
         try:
-            self.equity_strategy = EquityTechnicalStrategy()
-            signals = self.equity_strategy.generate_trading_signals()
+            module = importlib.import_module(config['module'])
+            strategy = getattr(module, config['class'])()
+            setattr(self, config['attr'], strategy)
+            signals = strategy.generate_trading_signals()
             
-            # 即使没有明确信号，也要提供观望建议
-            if signals and len(signals) > 0:
-                self.equity_strategy.generate_trading_report()
-                self.equity_strategy.save_trading_signals()
-                self.all_signals['equities'] = signals
-                self.analysis_status['equities'] = 'success'
-                print(f"✅ 股票技术分析完成，生成 {len(signals)} 个信号")
+            if signals and len(signals) > 0:  # 修复信号检查逻辑
+                strategy.generate_trading_report()
+                strategy.save_trading_signals()
+                self._record_result(asset_class, 'success', signals)
+                print(f"✅ {name}技术分析完成，生成 {len(signals)} 个信号")
                 return True
-            else:
-                # 生成观望建议
-                print("⚠️ 股票技术分析未生成明确信号，生成观望建议")
-                self.analysis_status['equities'] = 'watch_signals'
-                # 创建观望信号
-                watch_signals = self._generate_watch_signals('equities')
-                self.all_signals['equities'] = watch_signals
+            elif config['watch_fallback']:
+                # 即使没有明确信号，也要提供观望建议
+                print(f"⚠️ {name}技术分析未生成明确信号，生成观望建议")
+                self._record_result(asset_class, 'watch_signals', self._generate_watch_signals(asset_class))
                 return True
+            else:
+                print(f"⚠️ {name}技术分析未生成信号")
+                self._record_result(asset_class, 'no_signals')
+                return False
         except Exception as e:
-            print(f"❌ 股票技术分析失败：{e}")
-            self.analysis_status['equities'] = 'error'
-            # 即使失败也要生成观望建议
-            watch_signals = self._generate_watch_signals('equities')
-            self.all_signals['equities'] = watch_signals
+            print(f"❌ {name}技术分析失败：{e}")
+            if config['watch_fallback']:
+                # 即使失败也要生成观望建议
+                self._record_result(asset_class, 'error', self._generate_watch_signals(asset_class))
+            else:
+                self._record_result(asset_class, 'error')
             return False
     
+    def run_equity_analysis(self):
+        """运行股票技术分析"""
+        return self._run_analysis('equities')
+    
     def run_bond_analysis(self):
         """运行债券技术分析"""
-        print("🚀 开始债券技术分析...")
-        try:
-            self.bond_strategy = BondTechnicalStrategy()
-            signals = self.bond_strategy.generate_trading_signals()
-            if signals and len(signals) > 0:  # 修复信号检查逻辑
-                self.bond_strategy.generate_trading_report()
-                self.bond_strategy.save_trading_signals()
-                self.all_signals['bonds'] = signals
-                self.analysis_status['bonds'] = 'success'
-                print(f"✅ 债券技术分析完成，生成 {len(signals)} 个信号")
-                return True
-            else:
-                print("⚠️ 债券技术分析未生成信号")
-                self.analysis_status['bonds'] = 'no_signals'
-                return False
-        except Exception as e:
-            print(f"❌ 债券技术分析失败：{e}")
-            self.analysis_status['bonds'] = 'error'
-            return False
+        return self._run_analysis('bonds')
     
     def run_commodity_analysis(self):
         """运行大宗商品技术分析"""
-        print("🚀 开始大宗商品技术分析...")
-        try:
-            self.commodity_strategy = CommodityTechnicalStrategy()
-            signals = self.commodity_strategy.generate_trading_signals()
-            if signals and len(signals) > 0:  # 修复信号检查逻辑
-                self.commodity_strategy.generate_trading_report()
-                self.commodity_strategy.save_trading_signals()
-                self.all_signals['commodities'] = signals
-                self.analysis_status['commodities'] = 'success'
-                print(f"✅ 大宗商品技术分析完成，生成 {len(signals)} 个信号")
-                return True
-            else:
-                print("⚠️ 大宗商品技术分析未生成信号")
-                self.analysis_status['commodities'] = 'no_signals'
-                return False
-        except Exception as e:
-            print(f"❌ 大宗商品技术分析失败：{e}")
-            self.analysis_status['commodities'] = 'error'
-            return False
+        return self._run_analysis('commodities')
     
     def run_gold_analysis(self):
         """运行黄金技术分析"""
-        print("🚀 开始黄金技术分析...")
-        try:
-            self.gold_strategy = GoldTechnicalStrategy()
-            signals = self.gold_strategy.generate_trading_signals()
-            if signals and len(signals) > 0:  # 修复信号检查逻辑
-                self.gold_strategy.generate_trading_report()
-                self.gold_strategy.save_trading_signals()
-                self.all_signals['golds'] = signals
-                self.analysis_status['golds'] = 'success'
-                print(f"✅ 黄金技术分析完成，生成 {len(signals)} 个信号")
-                return True
-            else:
-                print("⚠️ 黄金技术分析未生成信号")
-                self.analysis_status['golds'] = 'no_signals'
-                return False
-        except Exception as e:
-            print(f"❌ 黄金技术分析失败：{e}")
-            self.analysis_status['golds'] = 'error'
-            return False
+        return self._run_analysis('golds')
     
     def run_all_analysis(self):
         """运行所有资产类别的技术分析"""
         print("🚀 开始全面技术分析...")
         
-        results = {
-            'equities': self.run_equity_analysis(),
-            'bonds': self.run_bond_analysis(),
-            'commodities': self.run_commodity_analysis(),
-            'golds': self.run_gold_analysis()
-        }
+        # 各资产类别互不依赖，并行运行；行情下载由 technical_indicators.download_price_data 加锁串行，
+        # 并行的只是指标和信号计算
+        asset_classes = list(_STRATEGIES)
+        with ThreadPoolExecutor(max_workers=len(asset_classes)) as executor:
+            results = dict(zip(asset_classes, executor.map(self._run_analysis, asset_classes)))
         
         success_count = sum(results.values())
         total_count = len(results)
@@ -150,18 +294,27 @@ class TechnicalAnalysisManager:
         print(f"✅ 技术分析完成：{success_count}/{total_count} 个资产类别成功")
         return results
     
-    def get_signals_summary(self):
-        """获取所有信号的汇总信息"""
+    def get_signals_summary(self, timestamp=None):
+        """
+        获取所有信号的汇总信息
+        
+        Args:
+            timestamp: 更新时间字符串，默认取当前时间（每次调用只格式化一次）
+        """
         summary = {}
+        if timestamp is None:
+            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         for asset_class, signals in self.all_signals.items():
-            if signals is not None and len(signals) > 0:  # 修复信号检查逻辑
+            if signals:
+                # 单次遍历统计各类信号数量
+                counts = Counter(s.get('signal') for s in signals.values())
                 summary[asset_class] = {
                     'count': len(signals),
-                    'buy_signals': len([s for s in signals.values() if s.get('signal') == 'BUY']) if isinstance(signals, dict) else 0,
-                    'sell_signals': len([s for s in signals.values() if s.get('signal') == 'SELL']) if isinstance(signals, dict) else 0,
-                    'hold_signals': len([s for s in signals.values() if s.get('signal') == 'HOLD']) if isinstance(signals, dict) else 0,
-                    'latest_update': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    'buy_signals': counts.get('BUY', 0),
+                    'sell_signals': counts.get('SELL', 0),
+                    'hold_signals': counts.get('HOLD', 0),
+                    'latest_update': timestamp
                 }
             else:
                 summary[asset_class] = {
@@ -177,21 +330,55 @@ class TechnicalAnalysisManager:
     def get_asset_class_signals(self, asset_class):
         """获取特定资产类别的信号"""
         signals = self.all_signals.get(asset_class, {})
-        if signals and len(signals) > 0:
-            # 转换为DataFrame格式以便显示
-            if isinstance(signals, dict):
-                df = pd.DataFrame.from_dict(signals, orient='index')
-                df.index.name = 'ticker'
-                df.reset_index(inplace=True)
-                return df
+        if signals:
+            # 转换为DataFrame格式以便显示：按行构建一次，再插入ticker列
+            df = pd.DataFrame(list(signals.values()))
+            df.insert(0, 'ticker', list(signals.keys()))
+            if 'signal' in df.columns:
+                df['signal'] = _to_categorical(df['signal'], SIGNAL_TYPES)
+            if 'asset_class' in df.columns:
+                df['asset_class'] = _to_categorical(df['asset_class'], ASSET_CLASSES)
+            return df
         return pd.DataFrame()
     
+    @property
+    def signals_df(self):
+        """
+        所有资产类别信号展开成的单个DataFrame（按信号版本号缓存）
+        
+        至少包含 asset_class, ticker, signal, strength, timestamp 列，其余信号字段原样保留；
+        返回副本，调用方修改结果不会写回缓存
+        """
+        if self._signals_df_cache is not None and self._signals_df_cache[0] == self._signals_version:
+            return self._signals_df_cache[1].copy()
+        
+        version = self._signals_version
+        frames = []
+        for asset_class, signals in self.all_signals.items():
+            if signals:
+                df = pd.DataFrame(list(signals.values())).drop(columns='asset_class', errors='ignore')
+                df.insert(0, 'ticker', list(signals.keys()))
+                df.insert(0, 'asset_class', asset_class)
+                frames.append(df)
+        
+        columns = ['asset_class', 'ticker', 'signal', 'strength', 'timestamp']
+        if frames:
+            df = pd.concat(frames, ignore_index=True)
+            df = df.reindex(columns=columns + [c for c in df.columns if c not in columns])
+        else:
+            df = pd.DataFrame(columns=columns)
+        df['signal'] = _to_categorical(df['signal'], SIGNAL_TYPES)
+        df['asset_class'] = _to_categorical(df['asset_class'], ASSET_CLASSES)
+        
+        self._signals_df_cache = (version, df)
+        return df.copy()
+    
     def filter_signals_by_strength(self, min_strength=0.7):
         """根据信号强度过滤信号"""
         filtered_signals = {}
         
         for asset_class, signals in self.all_signals.items():
-            if signals is not None and len(signals) > 0 and isinstance(signals, dict):
+            if signals:
                 strong_signals = {k: v for k, v in signals.items() if v.get('strength', 0) >= min_strength}
                 if strong_signals:
                     filtered_signals[asset_class] = strong_signals
@@ -199,64 +386,103 @@ class TechnicalAnalysisManager:
         return filtered_signals
     
     def get_top_signals(self, top_n=10):
-        """获取最强的N个信号"""
-        all_signals_list = []
+        """获取最强的N个信号（按信号版本号缓存，信号更新后自动重新计算）"""
+        # 返回副本，调用方修改结果不会写回缓存
+        return self._top_signals_cache(top_n, self._signals_version).copy()
+    
+    def _compute_top_signals(self, top_n, version):
+        """计算最强的N个信号，version 仅作为缓存键"""
+        # 收集所有资产类别的信号及强度，排名后只对选中的行构建DataFrame
+        tickers = []
+        records = []
+        strengths = []
+        asset_classes = []
         
         for asset_class, signals in self.all_signals.items():
-            if signals is not None and len(signals) > 0 and isinstance(signals, dict):
-                # 转换为DataFrame格式
-                signals_df = pd.DataFrame.from_dict(signals, orient='index')
-                signals_df.index.name = 'ticker'
-                signals_df.reset_index(inplace=True)
-                signals_df['asset_class'] = asset_class
-                all_signals_list.append(signals_df)
+            if signals:
+                for ticker, signal in signals.items():
+                    tickers.append(ticker)
+                    records.append(signal)
+                    strengths.append(signal.get('strength', np.nan))
+                    asset_classes.append(asset_class)
         
-        if all_signals_list:
-            combined_signals = pd.concat(all_signals_list, ignore_index=True)
-            if 'strength' in combined_signals.columns:
-                return combined_signals.nlargest(top_n, 'strength')
-            else:
-                return combined_signals.head(top_n)
+        if not tickers:
+            return pd.DataFrame()
         
-        return pd.DataFrame()
+        # argpartition 选出前k个（O(N)），只对这k个排序，避免全量排序
+        strength_arr = np.asarray(strengths, dtype=np.float64)
+        # 读取时缺少强度的信号记为NaN，不参与排名（不设按原顺序取前N个的兜底分支）
+        ranked = np.flatnonzero(~np.isnan(strength_arr))
+        k = max(0, min(top_n, ranked.size))
+        if k == 0:
+            idx = np.empty(0, dtype=np.intp)
+        else:
+            ranked_strength = strength_arr[ranked]
+            top = np.sort(np.argpartition(-ranked_strength, k - 1)[:k])
+            idx = ranked[top[np.argsort(-ranked_strength[top], kind='stable')]]
+        
+        # 只把选中的k行装箱为DataFrame，保留信号的全部字段（止损、目标价、建议等）
+        # ticker/signal/strength/asset_class 列始终存在，信号缺少对应字段时为空值
+        df = pd.DataFrame([records[i] for i in idx])
+        df.insert(0, 'ticker', [tickers[i] for i in idx])
+        df['asset_class'] = _to_categorical([asset_classes[i] for i in idx], ASSET_CLASSES)
+        df = df.reindex(columns=list(dict.fromkeys(['ticker', 'signal', 'strength', *df.columns, 'asset_class'])))
+        df['signal'] = _to_categorical(df['signal'], SIGNAL_TYPES)
+        return df
     
     def generate_comprehensive_report(self):
         """生成综合技术分析报告"""
+        # 信号未更新时直接复用上次生成的报告
+        # 返回深拷贝，调用方修改报告不会写回缓存
+        if self._report_cache is not None and self._report_cache[0] == self._signals_version:
+            return copy.deepcopy(self._report_cache[1])
+        
         print("📊 生成综合技术分析报告...")
+        version = self._signals_version
+        
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         report = {
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'analysis_status': self.analysis_status,
-            'signals_summary': self.get_signals_summary(),
+            'timestamp': timestamp,
+            'analysis_status': dict(self.analysis_status),
+            'signals_summary': self.get_signals_summary(timestamp),
             'top_signals': self.get_top_signals(20),
             'asset_class_signals': {}
         }
         
-        # 为每个资产类别生成详细报告
-        for asset_class in ['equities', 'bonds', 'commodities', 'golds']:
-            signals = self.all_signals.get(asset_class, {})
-            if signals and len(signals) > 0 and isinstance(signals, dict):
-                # 计算信号分布
-                signal_counts = {}
-                strength_values = []
-                for signal_data in signals.values():
-                    signal_type = signal_data.get('signal', 'UNKNOWN')
-                    signal_counts[signal_type] = signal_counts.get(signal_type, 0) + 1
-                    
-                    if 'strength' in signal_data:
-                        strength_values.append(signal_data['strength'])
-                
-                report['asset_class_signals'][asset_class] = {
-                    'total_signals': len(signals),
-                    'signal_distribution': signal_counts,
-                    'strength_stats': {
-                        'mean': np.mean(strength_values) if strength_values else 0,
-                        'max': np.max(strength_values) if strength_values else 0,
-                        'min': np.min(strength_values) if strength_values else 0
-                    } if strength_values else {}
-                }
+        # 为每个资产类别生成详细报告：各类别统计互不依赖，并行计算
+        class_signals = [(asset_class, self.all_signals.get(asset_class, {}))
+                         for asset_class in ['equities', 'bonds', 'commodities', 'golds']]
+        class_signals = [(asset_class, signals) for asset_class, signals in class_signals if signals]
+        if class_signals:
+            with ThreadPoolExecutor(max_workers=len(class_signals)) as executor:
+                stats = executor.map(self._per_class_stats, [signals for _, signals in class_signals])
+                for (asset_class, _), class_stats in zip(class_signals, stats):
+                    report['asset_class_signals'][asset_class] = class_stats
         
-        return report
+        self._report_cache = (version, report)
+        return copy.deepcopy(report)
+    
+    @staticmethod
+    def _per_class_stats(signals):
+        """计算单个资产类别的信号分布和强度统计"""
+        # 计算信号分布
+        signal_counts = dict(Counter(s.get('signal', 'UNKNOWN') for s in signals.values()))
+        # 强度值直接写入连续的float64数组，均值/最大/最小由numpy归约计算（跳过没有强度的信号）
+        strength_values = np.fromiter(
+            (s['strength'] for s in signals.values() if 'strength' in s),
+            dtype=np.float64
+        )
+        
+        return {
+            'total_signals': len(signals),
+            'signal_distribution': signal_counts,
+            'strength_stats': {
+                'mean': float(strength_values.mean()),
+                'max': float(strength_values.max()),
+                'min': float(strength_values.min())
+            } if strength_values.size else {}
+        }
     
     def save_comprehensive_report(self):
         """保存综合技术分析报告"""
@@ -271,14 +497,23 @@ class TechnicalAnalysisManager:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f"{report_dir}/comprehensive_technical_report_{timestamp}.json"
             
-            # 转换DataFrame为可序列化格式
-            serializable_report = report.copy()
-            if not report['top_signals'].empty:
-                serializable_report['top_signals'] = report['top_signals'].to_dict('records')
-            
-            import json
+            # 按顶层键逐段写入，峰值内存只取决于最大的一段而不是整份报告
             with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(serializable_report, f, ensure_ascii=False, indent=2, default=str)
+                f.write('{')
+                for i, (key, value) in enumerate(report.items()):
+                    f.write(',\n  ' if i else '\n  ')
+                    f.write(f'{_dumps_json(key)}: ')
+                    if isinstance(value, pd.DataFrame):
+                        # DataFrame逐行写出记录，不先整体转换为list of dict
+                        f.write('[')
+                        columns = list(value.columns)
+                        for j, row in enumerate(value.itertuples(index=False)):
+                            f.write(',\n    ' if j else '\n    ')
+                            f.write(_dumps_json(dict(zip(columns, row)), indent=False))
+                        f.write('\n  ]' if len(value) else ']')
+                    else:
+                        f.write(_dumps_json(value).replace('\n', '\n  '))
+                f.write('\n}\n')
             
             print(f"✅ 综合技术分析报告已保存：{filename}")
             return filename
@@ -299,12 +534,13 @@ class TechnicalAnalysisManager:
         }
         
         for asset_class, signals in self.all_signals.items():
-            if signals is not None and len(signals) > 0 and isinstance(signals, dict):
+            if signals:
+                counts = Counter(s.get('signal') for s in signals.values())
                 asset_summary = {
                     'count': len(signals),
-                    'buy': len([s for s in signals.values() if s.get('signal') == 'BUY']),
-                    'sell': len([s for s in signals.values() if s.get('signal') == 'SELL']),
-                    'hold': len([s for s in signals.values() if s.get('signal') == 'HOLD'])
+                    'buy': counts.get('BUY', 0),
+                    'sell': counts.get('SELL', 0),
+                    'hold': counts.get('HOLD', 0)
                 }
                 
                 summary['asset_class_breakdown'][asset_class] = asset_summary
@@ -325,7 +561,7 @@ class TechnicalAnalysisManager:
         validation_results = {}
         
         for asset_class, signals in self.all_signals.items():
-            if signals is not None and len(signals) > 0 and isinstance(signals, dict):
+            if signals:
                 validation = {
                     'data_quality': 'good' if len(signals) > 0 else 'poor',
                     'signal_coverage': 'complete' if all('signal' in s for s in signals.values()) else 'incomplete',
@@ -338,68 +574,9 @@ class TechnicalAnalysisManager:
 
     def _generate_watch_signals(self, asset_class):
         """为没有信号的资产类别生成观望建议"""
-        watch_signals = {}
-        
         # 根据资产类别生成不同的观望建议
-        if asset_class == 'equities':
-            # 生成更多股票的观望建议
-            sample_tickers = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'NVDA', 'META', 'NFLX', 'JPM', 'JNJ', 'V', 'PG', 'UNH', 'HD', 'MA']
-            for ticker in sample_tickers:
-                watch_signals[ticker] = {
-                    'strategy': 'technical_watch',
-                    'signal': 'WATCH',
-                    'strength': 1,
-                    'price': 0,  # 实际价格需要从数据获取
-                    'stop_loss': 0,
-                    'target': 0,
-                    'confidence': 0.3,
-                    'recommendation': '建议观望，一周内买入',
-                    'asset_class': asset_class
-                }
-        elif asset_class == 'bonds':
-            sample_tickers = ['TLT', 'IEF', 'SHY', 'AGG', 'BND', 'VCIT', 'VCSH', 'LQD', 'HYG', 'JNK', 'BNDX', 'VWOB', 'EMB', 'PCY', 'LEMB']
-            for ticker in sample_tickers:
-                watch_signals[ticker] = {
-                    'strategy': 'technical_watch',
-                    'signal': 'WATCH',
-                    'strength': 1,
-                    'price': 0,
-                    'stop_loss': 0,
-                    'target': 0,
-                    'confidence': 0.3,
-                    'recommendation': '建议观望，一周内买入',
-                    'asset_class': asset_class
-                }
-        elif asset_class == 'commodities':
-            sample_tickers = ['DIA', 'SPY', 'QQQ', 'IWM', 'GLD', 'SLV', 'USO', 'UNG', 'DBA', 'DBC', 'XLE', 'XLF', 'XLK', 'XLV', 'XLI']
-            for ticker in sample_tickers:
-                watch_signals[ticker] = {
-                    'strategy': 'technical_watch',
-                    'signal': 'WATCH',
-                    'strength': 1,
-                    'price': 0,
-                    'stop_loss': 0,
-                    'target': 0,
-                    'confidence': 0.3,
-                    'recommendation': '建议观望，一周内买入',
-                    'asset_class': asset_class
-                }
-        elif asset_class == 'golds':
-            sample_tickers = ['GLD', 'IAU', 'SGOL', 'GLDM', 'BAR', 'OUNZ', 'GLTR', 'AAAU', 'GLDE', 'BGLD', 'XAUUSD=X', 'GC=F', 'GLD', 'IAU', 'SGOL']
-            for ticker in sample_tickers:
-                watch_signals[ticker] = {
-                    'strategy': 'technical_watch',
-                    'signal': 'WATCH',
-                    'strength': 1,
-                    'price': 0,
-                    'stop_loss': 0,
-                    'target': 0,
-                    'confidence': 0.3,
-                    'recommendation': '建议观望，一周内买入',
-                    'asset_class': asset_class
-                }
-        
-        return watch_signals
+        return {ticker: {**_WATCH_TEMPLATE, 'asset_class': asset_class}
+                for ticker in _WATCH_TICKERS.get(asset_class, ())}
 
 def run_comprehensive_technical_analysis():
     """运行全面的技术分析"""
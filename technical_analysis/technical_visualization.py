@@ -6,14 +6,122 @@
 
 import pandas as pd
 import numpy as np
+import plotly
 import plotly.graph_objects as go
-import plotly.express as px
+import plotly.io as pio
 from plotly.subplots import make_subplots
-import streamlit as st
 from datetime import datetime, timedelta
+from functools import lru_cache
+import hashlib
+import os
 import warnings
 warnings.filterwarnings('ignore')
 
+# 时间线信号点超过该数量时改为二维分箱热力图
+TIMELINE_BINNING_THRESHOLD = 4000
+TIMELINE_BINS = 30
+
+# 图表JSON的磁盘缓存目录（位于项目根目录下，与启动目录无关），文件名包含信号哈希，可跨会话复用
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIG_CACHE_DIR = os.path.join(PROJECT_ROOT, '.streamlit', 'fig_cache')
+
+def _build_agg_cache(technical_manager):
+    """基于管理器展开后的信号表，一次计算各图表共用的聚合结果"""
+    df_all = technical_manager.signals_df
+    
+    # 两次分组得到各资产类别的指标和信号类型分布
+    metrics = df_all.assign(high_confidence=df_all['strength'] >= 0.7).groupby(
+        'asset_class', observed=True, sort=False
+    ).agg(
+        total_signals=('strength', 'size'),
+        avg_strength=('strength', 'mean'),
+        high_confidence_signals=('high_confidence', 'sum')
+    )
+    metrics.index = metrics.index.astype(str)
+    signal_dist = df_all.groupby(['asset_class', 'signal'], observed=True, sort=False).size().unstack(fill_value=0)
+    signal_dist.index = signal_dist.index.astype(str)
+    
+    # 热力图使用的 资产类别 x 信号类型 平均强度
+    df_core = df_all[df_all['signal'].isin(['BUY', 'SELL', 'HOLD'])]
+    strength_by_signal = df_core.groupby(['asset_class', 'signal'], observed=True, sort=False)['strength'].mean().dropna()
+    
+    return {
+        'summary': technical_manager.get_trading_summary(),
+        'signals': df_all,
+        'metrics': metrics,
+        'signal_dist': signal_dist,
+        'strength_by_signal': strength_by_signal
+    }
+
+def _signals_fingerprint(signals):
+    """计算信号数据的确定性哈希，作为图表缓存键"""
+    if signals.empty:
+        return 'empty'
+    row_hashes = pd.util.hash_pandas_object(signals.astype(str), index=False).to_numpy()
+    digest = hashlib.md5(row_hashes.tobytes())
+    digest.update('|'.join(map(str, signals.columns)).encode('utf-8'))
+    return digest.hexdigest()
+
+@lru_cache(maxsize=1)
+def _chart_code_version():
+    """本模块源码和plotly版本的哈希，图表代码或依赖升级后旧的磁盘缓存自动失效"""
+    with open(os.path.abspath(__file__), 'rb') as f:
+        digest = hashlib.md5(f.read())
+    digest.update(plotly.__version__.encode('utf-8'))
+    return digest.hexdigest()[:12]
+
+def _prune_fig_cache(keep_prefix):
+    """删除不属于当前信号和代码版本的缓存文件，目录只保留最新一组图表"""
+    try:
+        with os.scandir(FIG_CACHE_DIR) as it:
+            stale = [entry.path for entry in it
+                     if entry.name.endswith('.json') and not entry.name.startswith(keep_prefix)]
+    except OSError:
+        return
+    for path in stale:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def _render_chart(builder_name, signals_key, asset_class, _viz, _technical_manager, _agg):
+    """按信号哈希缓存图表；下划线参数不参与缓存键计算，内存缓存未命中时先查磁盘缓存"""
+    chart_name = builder_name if asset_class is None else f"{builder_name}_{asset_class}"
+    key_prefix = f"{_chart_code_version()}_{signals_key}_"
+    cache_path = os.path.join(FIG_CACHE_DIR, f"{key_prefix}{chart_name}.json")
+    
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return pio.from_json(f.read())
+        except Exception as e:
+            print(f"⚠️ 图表缓存读取失败，重新生成：{e}")
+    
+    builder = getattr(_viz, builder_name)
+    if asset_class is None:
+        fig = builder(_technical_manager, agg=_agg)
+    else:
+        fig = builder(_technical_manager, asset_class, agg=_agg)
+    
+    if fig is not None:
+        try:
+            os.makedirs(FIG_CACHE_DIR, exist_ok=True)
+            # 先写临时文件再替换，避免并发会话读到写了一半的缓存
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(fig.to_json())
+            os.replace(tmp_path, cache_path)
+            _prune_fig_cache(key_prefix)
+        except OSError as e:
+            print(f"⚠️ 图表缓存写入失败：{e}")
+    return fig
+
+@lru_cache(maxsize=1)
+def _cached_chart():
+    """首次展示图表时才导入streamlit，并用 st.cache_data 包装图表构建"""
+    import streamlit as st
+    return st.cache_data(show_spinner=False)(_render_chart)
+
 class TechnicalVisualization:
     """技术分析可视化类"""
     
@@ -28,10 +136,16 @@ class TechnicalVisualization:
             'commodities': '#2ca02c',
             'golds': '#d62728'
         }
+        # 预先生成 小写/大写/首字母大写 的键，查找信号类型或资产名称时无需再调用 .lower()
+        self._colors_ci = {variant: color for name, color in self.colors.items()
+                           for variant in (name, name.upper(), name.title())}
     
-    def create_signals_dashboard(self, technical_manager):
+    def create_signals_dashboard(self, technical_manager, agg=None):
         """创建技术信号仪表板"""
-        if not technical_manager.all_signals:
+        if agg is None:
+            agg = _build_agg_cache(technical_manager)
+        df_all = agg['signals']
+        if df_all.empty:
             return None
         
         # 创建子图
@@ -39,11 +153,16 @@ class TechnicalVisualization:
             rows=2, cols=2,
             subplot_titles=('信号分布', '资产类别信号数量', '信号强度分布', '信号时间分布'),
             specs=[[{"type": "pie"}, {"type": "bar"}],
-                   [{"type": "histogram"}, {"type": "scatter"}]]
+                   [{"type": "histogram"}, {"type": "scatter"}]],
+            figure=go.Figure(layout=go.Layout(
+                height=600,
+                title_text="技术分析信号仪表板",
+                showlegend=True
+            ))
         )
         
         # 1. 信号分布饼图
-        summary = technical_manager.get_trading_summary()
+        summary = agg['summary']
         signal_counts = [summary['buy_signals'], summary['sell_signals'], summary['hold_signals']]
         signal_labels = ['买入', '卖出', '持有']
         
@@ -58,30 +177,23 @@ class TechnicalVisualization:
         )
         
         # 2. 资产类别信号数量柱状图
-        asset_signals = []
-        asset_names = []
-        for asset_class, signals in technical_manager.all_signals.items():
-            if signals is not None and not signals.empty:
-                asset_signals.append(len(signals))
-                asset_names.append(asset_class.title())
+        asset_signals = agg['metrics']['total_signals'].tolist()
+        asset_names = [asset_class.title() for asset_class in agg['metrics'].index]
         
         fig.add_trace(
             go.Bar(
                 x=asset_names,
                 y=asset_signals,
                 name="资产类别信号",
-                marker_color=[self.colors.get(asset.lower(), '#6c757d') for asset in asset_names]
+                marker_color=[self._colors_ci.get(asset, '#6c757d') for asset in asset_names]
             ),
             row=1, col=2
         )
         
         # 3. 信号强度分布直方图
-        all_strengths = []
-        for signals in technical_manager.all_signals.values():
-            if signals is not None and not signals.empty and 'strength' in signals.columns:
-                all_strengths.extend(signals['strength'].dropna().tolist())
+        all_strengths = df_all['strength'].dropna().to_numpy()
         
-        if all_strengths:
+        if all_strengths.size:
             fig.add_trace(
                 go.Histogram(
                     x=all_strengths,
@@ -93,19 +205,14 @@ class TechnicalVisualization:
             )
         
         # 4. 信号时间分布散点图
-        all_timestamps = []
-        all_strengths_time = []
-        for asset_class, signals in technical_manager.all_signals.items():
-            if signals is not None and not signals.empty and 'timestamp' in signals.columns:
-                for _, signal in signals.iterrows():
-                    if pd.notna(signal['timestamp']):
-                        all_timestamps.append(signal['timestamp'])
-                        all_strengths_time.append(signal.get('strength', 0))
-        
-        if all_timestamps:
+        df_time = df_all[['timestamp', 'strength']]
+        df_time = df_time[df_time['timestamp'].notna()]
+        all_strengths_time = df_time['strength'].fillna(0).values
+        
+        if not df_time.empty:
             fig.add_trace(
-                go.Scatter(
-                    x=all_timestamps,
+                go.Scattergl(
+                    x=df_time['timestamp'],
                     y=all_strengths_time,
                     mode='markers',
                     name="信号时间分布",
@@ -119,18 +226,13 @@ class TechnicalVisualization:
                 row=2, col=2
             )
         
-        # 更新布局
-        fig.update_layout(
-            height=600,
-            title_text="技术分析信号仪表板",
-            showlegend=True
-        )
-        
         return fig
     
-    def create_asset_class_signals_chart(self, technical_manager, asset_class):
+    def create_asset_class_signals_chart(self, technical_manager, asset_class, agg=None):
         """创建特定资产类别的信号图表"""
-        signals = technical_manager.get_asset_class_signals(asset_class)
+        if agg is None:
+            agg = _build_agg_cache(technical_manager)
+        signals = agg['signals'][agg['signals']['asset_class'] == asset_class]
         if signals.empty:
             return None
         
@@ -138,236 +240,221 @@ class TechnicalVisualization:
         fig = make_subplots(
             rows=2, cols=1,
             subplot_titles=(f'{asset_class.title()} 信号分布', f'{asset_class.title()} 信号强度排名'),
-            vertical_spacing=0.1
+            specs=[[{"type": "pie"}], [{"type": "bar"}]],
+            vertical_spacing=0.1,
+            figure=go.Figure(layout=go.Layout(
+                height=500,
+                title_text=f"{asset_class.title()} 技术分析详情",
+                showlegend=False
+            ))
         )
         
         # 1. 信号分布饼图
-        if 'signal' in signals.columns:
-            signal_dist = signals['signal'].value_counts()
-            fig.add_trace(
-                go.Pie(
-                    labels=signal_dist.index,
-                    values=signal_dist.values,
-                    name="信号分布",
-                    marker_colors=[self.colors.get(signal.lower(), '#6c757d') for signal in signal_dist.index]
-                ),
-                row=1, col=1
-            )
+        # 该类别的信号都没有 signal 字段时分布表中没有对应行，按全0处理
+        signal_dist = agg['signal_dist'].reindex([asset_class]).fillna(0).iloc[0]
+        signal_dist = signal_dist[signal_dist > 0]
+        fig.add_trace(
+            go.Pie(
+                labels=signal_dist.index,
+                values=signal_dist.values,
+                name="信号分布",
+                marker_colors=[self._colors_ci.get(signal, '#6c757d') for signal in signal_dist.index]
+            ),
+            row=1, col=1
+        )
         
         # 2. 信号强度排名柱状图
-        if 'strength' in signals.columns:
-            top_signals = signals.nlargest(10, 'strength')
-            fig.add_trace(
-                go.Bar(
-                    x=top_signals['ticker'],
-                    y=top_signals['strength'],
-                    name="信号强度",
-                    marker_color='#17a2b8'
-                ),
-                row=2, col=1
-            )
-        
-        # 更新布局
-        fig.update_layout(
-            height=500,
-            title_text=f"{asset_class.title()} 技术分析详情",
-            showlegend=False
+        # argpartition 选出前10个（O(N)），只对这10个排序；没有强度的信号不参与排名
+        strength = signals['strength'].to_numpy(dtype=float)
+        ranked = np.flatnonzero(~np.isnan(strength))
+        k = min(10, ranked.size)
+        if k == 0:
+            idx = ranked
+        else:
+            ranked_strength = strength[ranked]
+            top = np.sort(np.argpartition(-ranked_strength, k - 1)[:k])
+            idx = ranked[top[np.argsort(-ranked_strength[top], kind='stable')]]
+        top_signals = signals.iloc[idx]
+        fig.add_trace(
+            go.Bar(
+                x=top_signals['ticker'],
+                y=top_signals['strength'],
+                name="信号强度",
+                marker_color='#17a2b8'
+            ),
+            row=2, col=1
         )
         
         return fig
     
-    def create_signal_strength_heatmap(self, technical_manager):
+    def create_signal_strength_heatmap(self, technical_manager, agg=None):
         """创建信号强度热力图"""
-        # 准备数据
-        asset_classes = []
-        signal_types = []
-        strength_values = []
-        
-        for asset_class, signals in technical_manager.all_signals.items():
-            if signals is not None and not signals.empty and 'signal' in signals.columns and 'strength' in signals.columns:
-                for signal_type in ['BUY', 'SELL', 'HOLD']:
-                    asset_signals = signals[signals['signal'] == signal_type]
-                    if not asset_signals.empty:
-                        avg_strength = asset_signals['strength'].mean()
-                        asset_classes.append(asset_class.title())
-                        signal_types.append(signal_type)
-                        strength_values.append(avg_strength)
-        
-        if not strength_values:
-            return None
+        if agg is None:
+            agg = _build_agg_cache(technical_manager)
+        strength_by_signal = agg['strength_by_signal']
         
-        # 创建热力图
-        df_heatmap = pd.DataFrame({
-            'Asset Class': asset_classes,
-            'Signal Type': signal_types,
-            'Strength': strength_values
-        })
+        if strength_by_signal.empty:
+            return None
         
-        # 透视表
-        pivot_table = df_heatmap.pivot(index='Asset Class', columns='Signal Type', values='Strength')
+        # 直接展开分组结果，不再构造中间透视表
+        pivot = strength_by_signal.unstack('signal').reindex(columns=['BUY', 'SELL', 'HOLD']).dropna(axis=1, how='all')
+        z = pivot.to_numpy()
+        text = np.where(np.isnan(z), '', np.round(z, 2).astype(str))
         
         fig = go.Figure(data=go.Heatmap(
-            z=pivot_table.values,
-            x=pivot_table.columns,
-            y=pivot_table.index,
+            z=z,
+            x=pivot.columns,
+            y=pivot.index.str.title(),
             colorscale='Viridis',
-            text=np.round(pivot_table.values, 2),
+            text=text,
             texttemplate="%{text}",
             textfont={"size": 12},
             hoverongaps=False
-        ))
-        
-        fig.update_layout(
+        ), layout=go.Layout(
             title="信号强度热力图",
             xaxis_title="信号类型",
             yaxis_title="资产类别",
             height=400
-        )
+        ))
         
         return fig
     
-    def create_signal_timeline(self, technical_manager):
+    def create_signal_timeline(self, technical_manager, agg=None):
         """创建信号时间线图"""
+        if agg is None:
+            agg = _build_agg_cache(technical_manager)
+        
         # 收集所有信号的时间信息
-        timeline_data = []
-        
-        for asset_class, signals in technical_manager.all_signals.items():
-            if signals is not None and not signals.empty and 'timestamp' in signals.columns:
-                for _, signal in signals.iterrows():
-                    if pd.notna(signal['timestamp']):
-                        timeline_data.append({
-                            'asset_class': asset_class,
-                            'ticker': signal.get('ticker', 'N/A'),
-                            'signal': signal.get('signal', 'N/A'),
-                            'strength': signal.get('strength', 0),
-                            'timestamp': signal['timestamp']
-                        })
-        
-        if not timeline_data:
+        df_timeline = agg['signals'][['asset_class', 'ticker', 'signal', 'strength', 'timestamp']]
+        df_timeline = df_timeline[df_timeline['timestamp'].notna()]
+        if df_timeline.empty:
             return None
         
-        df_timeline = pd.DataFrame(timeline_data)
+        df_timeline = df_timeline.fillna({'strength': 0})
+        # 时间线只展示买入/卖出/持有信号，分箱阈值和分箱计数也只针对这些信号
+        points = df_timeline[df_timeline['signal'].isin(['BUY', 'SELL', 'HOLD'])]
         
         # 创建时间线图
-        fig = go.Figure()
-        
-        for asset_class in df_timeline['asset_class'].unique():
-            asset_data = df_timeline[df_timeline['asset_class'] == asset_class]
-            
-            for signal_type in ['BUY', 'SELL', 'HOLD']:
-                signal_data = asset_data[asset_data['signal'] == signal_type]
-                if not signal_data.empty:
-                    fig.add_trace(go.Scatter(
-                        x=signal_data['timestamp'],
-                        y=signal_data['strength'],
-                        mode='markers',
-                        name=f"{asset_class.title()} - {signal_type}",
-                        marker=dict(
-                            size=10,
-                            symbol='circle',
-                            color=self.colors.get(signal_type.lower(), '#6c757d')
-                        ),
-                        text=signal_data['ticker'],
-                        hovertemplate="<b>%{text}</b><br>" +
-                                    "时间: %{x}<br>" +
-                                    "强度: %{y:.2f}<br>" +
-                                    "<extra></extra>"
-                    ))
-        
-        fig.update_layout(
+        fig = go.Figure(layout=go.Layout(
             title="技术信号时间线",
             xaxis_title="时间",
             yaxis_title="信号强度",
             height=500,
             hovermode='closest'
-        )
+        ))
+        
+        if len(points) > TIMELINE_BINNING_THRESHOLD:
+            # 信号过多时按 (时间, 强度) 分箱计数，避免逐点绘制
+            timestamps = pd.to_datetime(points['timestamp']).values.astype('datetime64[ns]').astype('int64')
+            counts, x_edges, y_edges = np.histogram2d(
+                timestamps, points['strength'].astype(float),
+                bins=(TIMELINE_BINS, TIMELINE_BINS)
+            )
+            fig.add_trace(go.Heatmap(
+                z=counts.T,
+                x=pd.to_datetime(x_edges[:-1].astype('int64')),
+                y=y_edges[:-1],
+                colorscale='Viridis',
+                hovertemplate="时间: %{x}<br>" +
+                            "强度: %{y:.2f}<br>" +
+                            "信号数: %{z}<br>" +
+                            "<extra></extra>"
+            ))
+        else:
+            # 所有信号合并为一条轨迹，颜色按信号类型逐点映射
+            if not points.empty:
+                signal_types = points['signal'].astype(str)
+                signal_colors = {signal_type: self._colors_ci.get(signal_type, '#6c757d')
+                                 for signal_type in ['BUY', 'SELL', 'HOLD']}
+                fig.add_trace(go.Scattergl(
+                    x=points['timestamp'],
+                    y=points['strength'],
+                    mode='markers',
+                    name="技术信号",
+                    marker=dict(
+                        size=10,
+                        symbol='circle',
+                        color=signal_types.map(signal_colors)
+                    ),
+                    text=points['ticker'].astype(str) + ' (' + points['asset_class'].astype(str).str.title() + ' - ' + signal_types + ')',
+                    hovertemplate="<b>%{text}</b><br>" +
+                                "时间: %{x}<br>" +
+                                "强度: %{y:.2f}<br>" +
+                                "<extra></extra>"
+                ))
         
         return fig
     
-    def create_performance_metrics(self, technical_manager):
+    def create_performance_metrics(self, technical_manager, agg=None):
         """创建性能指标图表"""
-        # 计算各种性能指标
-        metrics = {}
-        
-        for asset_class, signals in technical_manager.all_signals.items():
-            if signals is not None and not signals.empty:
-                asset_metrics = {
-                    'total_signals': len(signals),
-                    'avg_strength': 0,
-                    'signal_distribution': {},
-                    'high_confidence_signals': 0
-                }
-                
-                if 'strength' in signals.columns:
-                    asset_metrics['avg_strength'] = signals['strength'].mean()
-                    asset_metrics['high_confidence_signals'] = len(signals[signals['strength'] >= 0.7])
-                
-                if 'signal' in signals.columns:
-                    asset_metrics['signal_distribution'] = signals['signal'].value_counts().to_dict()
-                
-                metrics[asset_class] = asset_metrics
+        if agg is None:
+            agg = _build_agg_cache(technical_manager)
+        metrics = agg['metrics']
         
         # 创建性能指标图表
         fig = make_subplots(
             rows=2, cols=2,
             subplot_titles=('信号数量对比', '平均信号强度', '高置信度信号比例', '信号类型分布'),
             specs=[[{"type": "bar"}, {"type": "bar"}],
-                   [{"type": "bar"}, {"type": "pie"}]]
+                   [{"type": "bar"}, {"type": "pie"}]],
+            figure=go.Figure(layout=go.Layout(
+                height=600,
+                title_text="技术分析性能指标",
+                showlegend=False
+            ))
         )
         
+        # 三个柱状图共用的横轴名称和颜色
+        asset_names = list(metrics.index)
+        title_names = [asset.title() for asset in asset_names]
+        bar_colors = [self.colors.get(asset, '#6c757d') for asset in asset_names]
+        
         # 1. 信号数量对比
-        asset_names = list(metrics.keys())
-        signal_counts = [metrics[asset]['total_signals'] for asset in asset_names]
+        signal_counts = metrics['total_signals']
         
         fig.add_trace(
             go.Bar(
-                x=[asset.title() for asset in asset_names],
+                x=title_names,
                 y=signal_counts,
                 name="信号数量",
-                marker_color=[self.colors.get(asset, '#6c757d') for asset in asset_names]
+                marker_color=bar_colors
             ),
             row=1, col=1
         )
         
         # 2. 平均信号强度
-        avg_strengths = [metrics[asset]['avg_strength'] for asset in asset_names]
+        avg_strengths = metrics['avg_strength']
         
         fig.add_trace(
             go.Bar(
-                x=[asset.title() for asset in asset_names],
+                x=title_names,
                 y=avg_strengths,
                 name="平均强度",
-                marker_color=[self.colors.get(asset, '#6c757d') for asset in asset_names]
+                marker_color=bar_colors
             ),
             row=1, col=2
         )
         
         # 3. 高置信度信号比例
-        high_conf_ratios = []
-        for asset in asset_names:
-            if metrics[asset]['total_signals'] > 0:
-                ratio = metrics[asset]['high_confidence_signals'] / metrics[asset]['total_signals']
-                high_conf_ratios.append(ratio)
-            else:
-                high_conf_ratios.append(0)
+        counts = metrics['total_signals'].to_numpy()
+        highs = metrics['high_confidence_signals'].to_numpy()
+        high_conf_ratios = np.where(counts > 0, highs / np.maximum(counts, 1), 0.0)
         
         fig.add_trace(
             go.Bar(
-                x=[asset.title() for asset in asset_names],
+                x=title_names,
                 y=high_conf_ratios,
                 name="高置信度比例",
-                marker_color=[self.colors.get(asset, '#6c757d') for asset in asset_names]
+                marker_color=bar_colors
             ),
             row=2, col=1
         )
         
         # 4. 总体信号类型分布
-        all_signals = []
-        all_types = []
-        for asset_metrics in metrics.values():
-            for signal_type, count in asset_metrics['signal_distribution'].items():
-                all_signals.append(count)
-                all_types.append(signal_type)
+        type_totals = agg['signal_dist'].sum()
+        type_totals = type_totals[type_totals > 0]
+        all_signals = type_totals.tolist()
+        all_types = [str(signal_type) for signal_type in type_totals.index]
         
         if all_signals:
             fig.add_trace(
@@ -375,41 +462,44 @@ class TechnicalVisualization:
                     labels=all_types,
                     values=all_signals,
                     name="信号类型分布",
-                    marker_colors=[self.colors.get(signal_type.lower(), '#6c757d') for signal_type in all_types]
+                    marker_colors=[self._colors_ci.get(signal_type, '#6c757d') for signal_type in all_types]
                 ),
                 row=2, col=2
             )
         
-        # 更新布局
-        fig.update_layout(
-            height=600,
-            title_text="技术分析性能指标",
-            showlegend=False
-        )
-        
         return fig
     
     def display_all_charts(self, technical_manager):
         """显示所有图表"""
+        import streamlit as st
+        
         st.subheader("📊 技术分析可视化")
         
+        # 各图表共用的聚合结果只计算一次
+        agg = _build_agg_cache(technical_manager)
+        signals_key = _signals_fingerprint(agg['signals'])
+        render = _cached_chart()
+        
+        def chart(builder_name, asset_class=None):
+            return render(builder_name, signals_key, asset_class, self, technical_manager, agg)
+        
         # 1. 信号仪表板
-        dashboard = self.create_signals_dashboard(technical_manager)
+        dashboard = chart('create_signals_dashboard')
         if dashboard:
             st.plotly_chart(dashboard, use_container_width=True)
         
         # 2. 信号强度热力图
-        heatmap = self.create_signal_strength_heatmap(technical_manager)
+        heatmap = chart('create_signal_strength_heatmap')
         if heatmap:
             st.plotly_chart(heatmap, use_container_width=True)
         
         # 3. 信号时间线
-        timeline = self.create_signal_timeline(technical_manager)
+        timeline = chart('create_signal_timeline')
         if timeline:
             st.plotly_chart(timeline, use_container_width=True)
         
         # 4. 性能指标
-        performance = self.create_performance_metrics(technical_manager)
+        performance = chart('create_performance_metrics')
         if performance:
             st.plotly_chart(performance, use_container_width=True)
         
@@ -417,12 +507,13 @@ class TechnicalVisualization:
         st.subheader("📈 各资产类别详细分析")
         
         for asset_class in ['equities', 'bonds', 'commodities', 'golds']:
-            asset_chart = self.create_asset_class_signals_chart(technical_manager, asset_class)
+            asset_chart = chart('create_asset_class_signals_chart', asset_class)
             if asset_chart:
                 st.plotly_chart(asset_chart, use_container_width=True)
 
+@lru_cache(maxsize=1)
 def create_technical_visualization():
-    """创建技术分析可视化实例"""
+    """创建技术分析可视化实例（进程内复用同一实例）"""
     return TechnicalVisualization()
 
 if __name__ == "__main__":
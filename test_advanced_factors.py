@@ -31,13 +31,14 @@ def test_advanced_equity_factors():
             print(f"{'代码':<8} {'市值(B)':<10} {'PE':<8} {'PB':<8} {'综合得分':<10}")
             print("-" * 80)
             
-            for _, stock in top_stocks.iterrows():
-                market_cap_b = stock['marketCap'] / 1e9 if stock['marketCap'] else 0
-                pe = stock['trailingPE'] if stock['trailingPE'] else 0
-                pb = stock['priceToBook'] if stock['priceToBook'] else 0
-                score = stock['composite_score_normalized']
-                
-                print(f"{stock['ticker']:<8} {market_cap_b:<10.1f} {pe:<8.1f} {pb:<8.2f} {score:<10.3f}")
+            # 先按列计算展示字段，再用 itertuples 逐行输出
+            top_stocks = top_stocks.assign(
+                market_cap_b=top_stocks['marketCap'].fillna(0) / 1e9,
+                pe=top_stocks['trailingPE'].fillna(0),
+                pb=top_stocks['priceToBook'].fillna(0)
+            )
+            for stock in top_stocks.itertuples(index=False):
+                print(f"{stock.ticker:<8} {stock.market_cap_b:<10.1f} {stock.pe:<8.1f} {stock.pb:<8.2f} {stock.composite_score_normalized:<10.3f}")
             
             return True
         else:
@@ -7,6 +7,7 @@
 import sys
 import os
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 # 添加项目路径
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -29,6 +30,25 @@ for path in paths_to_add:
     if path not in sys.path:
         sys.path.insert(0, path)
 
+# 各测试共享的技术分析管理器，首次使用时创建
+_manager = None
+
+# 已确认缺失的第三方依赖（顶层包名），依赖这些包的后续测试直接跳过
+_missing_deps = set()
+
+def _record_missing_dep(error):
+    """从导入错误中记录缺失的顶层包名"""
+    if getattr(error, 'name', None):
+        _missing_deps.add(error.name.split('.')[0])
+
+def _get_manager():
+    """获取共享的技术分析管理器实例"""
+    global _manager
+    if _manager is None:
+        from technical_analysis.technical_signals import TechnicalAnalysisManager
+        _manager = TechnicalAnalysisManager()
+    return _manager
+
 def test_macro_analysis():
     """测试宏观分析模块"""
     print("\n🔍 测试宏观分析模块...")
@@ -51,6 +71,7 @@ def test_macro_analysis():
             return False
             
     except ImportError as e:
+        _record_missing_dep(e)
         print(f"❌ 宏观分析模块导入失败: {e}")
         return False
 
@@ -78,6 +99,7 @@ def test_fundamental_analysis():
             return False
             
     except ImportError as e:
+        _record_missing_dep(e)
         print(f"❌ 基本面分析模块导入失败: {e}")
         return False
 
@@ -91,7 +113,7 @@ def test_technical_analysis():
         
         # 创建管理器实例
         try:
-            manager = TechnicalAnalysisManager()
+            manager = _get_manager()
             print("✅ 技术分析管理器创建成功")
             
             # 测试获取信号汇总
@@ -101,33 +123,18 @@ def test_technical_analysis():
             # 测试各个资产类别的分析
             print("\n📊 测试各资产类别分析...")
             
-            # 股票分析
-            try:
-                equity_result = manager.run_equity_analysis()
-                print(f"✅ 股票技术分析: {'成功' if equity_result else '未生成信号'}")
-            except Exception as e:
-                print(f"⚠️ 股票技术分析异常: {e}")
+            # 四个资产类别的分析互不依赖，并行运行；yf.download 不是线程安全的，
+            # 各策略的行情下载由 technical_indicators.download_price_data 加锁串行执行
+            analyses = {'equity': '股票', 'bond': '债券', 'commodity': '大宗商品', 'gold': '黄金'}
+            with ThreadPoolExecutor(max_workers=len(analyses)) as executor:
+                futures = {name: executor.submit(getattr(manager, f'run_{name}_analysis')) for name in analyses}
             
-            # 债券分析
-            try:
-                bond_result = manager.run_bond_analysis()
-                print(f"✅ 债券技术分析: {'成功' if bond_result else '未生成信号'}")
-            except Exception as e:
-                print(f"⚠️ 债券技术分析异常: {e}")
-            
-            # 大宗商品分析
-            try:
-                commodity_result = manager.run_commodity_analysis()
-                print(f"✅ 大宗商品技术分析: {'成功' if commodity_result else '未生成信号'}")
-            except Exception as e:
-                print(f"⚠️ 大宗商品技术分析异常: {e}")
-            
-            # 黄金分析
-            try:
-                gold_result = manager.run_gold_analysis()
-                print(f"✅ 黄金技术分析: {'成功' if gold_result else '未生成信号'}")
-            except Exception as e:
-                print(f"⚠️ 黄金技术分析异常: {e}")
+            for name, future in futures.items():
+                try:
+                    result = future.result()
+                    print(f"✅ {analyses[name]}技术分析: {'成功' if result else '未生成信号'}")
+                except Exception as e:
+                    print(f"⚠️ {analyses[name]}技术分析异常: {e}")
             
             return True
             
@@ -137,6 +144,7 @@ def test_technical_analysis():
             return False
             
     except ImportError as e:
+        _record_missing_dep(e)
         print(f"❌ 技术分析模块导入失败: {e}")
         return False
 
@@ -165,6 +173,10 @@ def test_streamlit_app():
         
         return True
         
+    except ImportError as e:
+        _record_missing_dep(e)
+        print(f"❌ Streamlit应用导入失败: {e}")
+        return False
     except Exception as e:
         print(f"❌ Streamlit应用测试失败: {e}")
         traceback.print_exc()
@@ -177,11 +189,22 @@ def main():
     
     test_results = {}
     
-    # 测试各个模块
-    test_results['macro'] = test_macro_analysis()
-    test_results['fundamental'] = test_fundamental_analysis()
-    test_results['technical'] = test_technical_analysis()
-    test_results['streamlit'] = test_streamlit_app()
+    # 测试各个模块：(名称, 测试函数, 依赖的第三方包)
+    tests = [
+        ('macro', test_macro_analysis, ('pandas', 'fredapi', 'dotenv')),
+        ('fundamental', test_fundamental_analysis, ('pandas', 'numpy')),
+        ('technical', test_technical_analysis, ('pandas', 'numpy')),
+        ('streamlit', test_streamlit_app, ('streamlit', 'pandas', 'numpy', 'plotly')),
+    ]
+    
+    for name, test_func, deps in tests:
+        missing = _missing_deps.intersection(deps)
+        if missing:
+            # 前面的测试已确认依赖缺失，结果必然相同，跳过
+            print(f"\n⏭️ 跳过 {name} 测试，缺少依赖: {', '.join(sorted(missing))}")
+            test_results[name] = False
+            continue
+        test_results[name] = test_func()
     
     # 显示测试结果汇总
     print("\n" + "=" * 60)
@@ -12,6 +12,8 @@ from datetime import datetime
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(current_dir)
 
+from testing_support import run_test
+
 def test_stock_list_loading():
     """测试股票列表加载"""
     print("🔍 测试股票列表加载...")
@@ -67,13 +69,40 @@ def test_config_loading():
         print(f"✅ 配置加载成功")
         print(f"   最小市值：${STOCK_SCREENING_CONFIG['MIN_MARKET_CAP']/1e9:.1f}B")
         print(f"   目标股票数：{STOCK_SCREENING_CONFIG['TARGET_STOCK_COUNT']}只")
-        print(f"   基准权重：{BASELINE_WEIGHTS}")
+        print(f"   基准权重：{dict(BASELINE_WEIGHTS)}")
         
         return True
     except Exception as e:
         print(f"❌ 配置加载失败：{e}")
         return False
 
+def test_config_mapping():
+    """测试配置对象仍可按原有字典方式读取"""
+    print("🔍 测试配置映射接口...")
+    from utils.config import STOCK_SCREENING_CONFIG, BASELINE_WEIGHTS
+    
+    # 与改为dataclass之前的字典取值一致
+    old_weights = {"equities": 30, "bonds_mid": 15, "bonds_long": 40, "gold": 7.5, "commodities": 7.5}
+    assert dict(BASELINE_WEIGHTS) == old_weights
+    assert list(BASELINE_WEIGHTS) == list(old_weights)
+    assert [BASELINE_WEIGHTS[key] for key in old_weights] == list(old_weights.values())
+    assert STOCK_SCREENING_CONFIG['MIN_MARKET_CAP'] == 10e9
+    assert STOCK_SCREENING_CONFIG['TARGET_STOCK_COUNT'] == 40
+    
+    # in / get 只识别配置字段，方法名等其他属性按不存在处理
+    assert 'MIN_ROE' in STOCK_SCREENING_CONFIG
+    assert 'keys' not in STOCK_SCREENING_CONFIG
+    assert STOCK_SCREENING_CONFIG.get('keys') is None
+    assert STOCK_SCREENING_CONFIG.get('MIN_PE', -1) == 0
+    try:
+        STOCK_SCREENING_CONFIG['UNKNOWN_KEY']
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("未知配置键应抛出KeyError")
+    
+    print("✅ 配置映射接口测试通过")
+
 def test_main_integration():
     """测试主程序集成"""
     print("🔍 测试主程序集成...")
@@ -105,6 +134,7 @@ def run_all_tests():
     
     tests = [
         ("配置加载", test_config_loading),
+        ("配置映射接口", lambda: run_test(test_config_mapping)),
         ("股票列表加载", test_stock_list_loading),
         ("股票筛选", test_equity_screening),
         ("主程序集成", test_main_integration)
@@ -9,180 +9,177 @@ import sys
 import os
 import pandas as pd
 from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 # 添加项目路径
 current_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, current_dir)
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
 
-def test_fundamental_analysis():
+from testing_support import create_shared, run_test, new_fundamental_manager, new_technical_manager, new_portfolio_system
+
+# 四个资产类别的分析方法后缀及中文名称
+ASSET_ANALYSES = {'equity': '股票', 'bond': '债券', 'commodity': '商品', 'gold': '黄金'}
+
+# 投资组合生成测试使用的模拟数据，导入时构建一次
+_EQUITY_FIXTURE = pd.DataFrame({
+    'ticker': ['AAPL', 'MSFT', 'GOOGL'],
+    'name': ['Apple Inc.', 'Microsoft Corp.', 'Alphabet Inc.'],
+    'sector': ['Technology', 'Technology', 'Technology'],
+    'market_cap': ['Large', 'Large', 'Large']
+})
+
+_SIGNALS_FIXTURE = {
+    'equities': {
+        'AAPL': {'signal': 'BUY', 'strategy': 'momentum_breakout', 'confidence': 0.8, 'recommendation': '建议一周内买入'},
+        'MSFT': {'signal': 'WATCH', 'strategy': 'mean_reversion', 'confidence': 0.6, 'recommendation': '建议观望，一周内买入'}
+    },
+    'bonds': {
+        'TLT': {'signal': 'WATCH', 'strategy': 'technical_watch', 'confidence': 0.5, 'recommendation': '建议观望，一周内买入'}
+    }
+}
+
+def _run_all_parallel(manager):
+    """
+    并行运行四个资产类别的分析（互不依赖）
+    
+    yf.download 不是线程安全的，各策略的行情下载由 technical_indicators.download_price_data 加锁串行执行
+    """
+    with ThreadPoolExecutor(max_workers=len(ASSET_ANALYSES)) as executor:
+        futures = {name: executor.submit(getattr(manager, f'run_{name}_analysis')) for name in ASSET_ANALYSES}
+    return {name: future.result() for name, future in futures.items()}
+
+def test_fundamental_analysis(fundamental_manager):
     """测试基本面分析"""
     print("🔍 测试基本面分析...")
-    try:
-        from fundamental_analysis.fundamental_manager import FundamentalAnalysisManager
-        
-        manager = FundamentalAnalysisManager()
-        
-        # 测试股票分析
-        print("  📊 测试股票分析...")
-        equity_success = manager.run_equity_analysis()
-        print(f"    股票分析结果: {'✅ 成功' if equity_success else '❌ 失败'}")
-        
-        # 测试债券分析
-        print("  📊 测试债券分析...")
-        bond_success = manager.run_bond_analysis()
-        print(f"    债券分析结果: {'✅ 成功' if bond_success else '❌ 失败'}")
-        
-        # 测试商品分析
-        print("  📊 测试商品分析...")
-        commodity_success = manager.run_commodity_analysis()
-        print(f"    商品分析结果: {'✅ 成功' if commodity_success else '❌ 失败'}")
-        
-        # 测试黄金分析
-        print("  📊 测试黄金分析...")
-        gold_success = manager.run_gold_analysis()
-        print(f"    黄金分析结果: {'✅ 成功' if gold_success else '❌ 失败'}")
-        
-        # 检查结果
-        all_assets = manager.all_selected_assets
-        print(f"  📋 选中的资产数量:")
-        for asset_class, assets in all_assets.items():
-            if isinstance(assets, pd.DataFrame):
-                print(f"    {asset_class}: {len(assets)} 个")
-            else:
-                print(f"    {asset_class}: {len(assets) if assets else 0} 个")
-        
-        return True
-        
-    except Exception as e:
-        print(f"  ❌ 基本面分析测试失败: {e}")
-        return False
+    manager = fundamental_manager
+    
+    # 并行测试各资产类别分析
+    print("  📊 测试股票、债券、商品、黄金分析...")
+    results = _run_all_parallel(manager)
+    for name, label in ASSET_ANALYSES.items():
+        print(f"    {label}分析结果: {'✅ 成功' if results[name] else '❌ 失败'}")
+    
+    # 检查结果
+    all_assets = manager.all_selected_assets
+    assert isinstance(all_assets, dict), "选中的资产应按资产类别组织为字典"
+    print(f"  📋 选中的资产数量:")
+    for asset_class, assets in all_assets.items():
+        if isinstance(assets, pd.DataFrame):
+            print(f"    {asset_class}: {len(assets)} 个")
+        else:
+            print(f"    {asset_class}: {len(assets) if assets else 0} 个")
 
-def test_technical_analysis():
+def test_technical_analysis(technical_manager):
     """测试技术分析"""
     print("📈 测试技术分析...")
-    try:
-        from technical_analysis.technical_signals import TechnicalAnalysisManager
-        
-        manager = TechnicalAnalysisManager()
-        
-        # 测试股票技术分析
-        print("  📊 测试股票技术分析...")
-        equity_success = manager.run_equity_analysis()
-        print(f"    股票技术分析结果: {'✅ 成功' if equity_success else '❌ 失败'}")
-        
-        # 检查信号
-        if 'equities' in manager.all_signals:
-            signals = manager.all_signals['equities']
-            print(f"    股票信号数量: {len(signals)}")
-            if signals:
-                sample_signal = list(signals.values())[0]
-                print(f"    信号示例: {sample_signal.get('signal', 'N/A')} - {sample_signal.get('recommendation', 'N/A')}")
-        
-        # 测试债券技术分析
-        print("  📊 测试债券技术分析...")
-        bond_success = manager.run_bond_analysis()
-        print(f"    债券技术分析结果: {'✅ 成功' if bond_success else '❌ 失败'}")
-        
-        # 测试商品技术分析
-        print("  📊 测试商品技术分析...")
-        commodity_success = manager.run_commodity_analysis()
-        print(f"    商品技术分析结果: {'✅ 成功' if commodity_success else '❌ 失败'}")
-        
-        # 测试黄金技术分析
-        print("  📊 测试黄金技术分析...")
-        gold_success = manager.run_gold_analysis()
-        print(f"    黄金技术分析结果: {'✅ 成功' if gold_success else '❌ 失败'}")
-        
-        # 检查所有信号
-        print(f"  📋 技术分析信号汇总:")
-        for asset_class, signals in manager.all_signals.items():
-            print(f"    {asset_class}: {len(signals)} 个信号")
-            if signals:
-                signal_types = {}
-                for signal in signals.values():
-                    signal_type = signal.get('signal', 'WATCH')
-                    signal_types[signal_type] = signal_types.get(signal_type, 0) + 1
-                print(f"      信号类型: {signal_types}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"  ❌ 技术分析测试失败: {e}")
-        return False
+    manager = technical_manager
+    
+    # 并行测试各资产类别技术分析
+    print("  📊 测试股票、债券、商品、黄金技术分析...")
+    results = _run_all_parallel(manager)
+    for name, label in ASSET_ANALYSES.items():
+        print(f"    {label}技术分析结果: {'✅ 成功' if results[name] else '❌ 失败'}")
+    
+    # 股票分析无信号或失败时也会生成观望建议
+    assert manager.all_signals.get('equities'), "股票技术分析应至少生成观望建议"
+    signals = manager.all_signals['equities']
+    print(f"    股票信号数量: {len(signals)}")
+    sample_signal = list(signals.values())[0]
+    print(f"    信号示例: {sample_signal.get('signal', 'N/A')} - {sample_signal.get('recommendation', 'N/A')}")
+    
+    # 检查所有信号
+    print(f"  📋 技术分析信号汇总:")
+    for asset_class, signals in manager.all_signals.items():
+        print(f"    {asset_class}: {len(signals)} 个信号")
+        if signals:
+            signal_types = Counter(signal.get('signal', 'WATCH') for signal in signals.values())
+            print(f"      信号类型: {dict(signal_types)}")
 
-def test_portfolio_generation():
-    """测试投资组合生成"""
-    print("💼 测试投资组合生成...")
-    try:
-        from interactive_portfolio_app import CompletePortfolioSystem
-        
-        system = CompletePortfolioSystem()
-        
-        # 模拟资产配置
-        system.asset_allocation = {
-            'equities': 40,
-            'bonds_mid': 20,
-            'bonds_long': 20,
-            'gold': 10,
-            'commodities': 10
+def test_signal_caches():
+    """测试技术信号缓存：信号更新后重新计算，调用方修改返回结果不会写回缓存"""
+    print("🗂️ 测试技术信号缓存...")
+    # 使用独立的管理器，不改动其他测试共用的实例
+    manager = new_technical_manager()
+    manager.all_signals = {
+        'equities': {
+            'AAPL': {'signal': 'BUY', 'strength': 0.8, 'stop_loss': 150, 'reason': 'breakout'},
+            'MSFT': {'signal': 'HOLD', 'strength': 0.6}
         }
-        
-        # 模拟基本面分析结果
-        system.equity_candidates = pd.DataFrame([
-            {'ticker': 'AAPL', 'name': 'Apple Inc.', 'sector': 'Technology', 'market_cap': 'Large'},
-            {'ticker': 'MSFT', 'name': 'Microsoft Corp.', 'sector': 'Technology', 'market_cap': 'Large'},
-            {'ticker': 'GOOGL', 'name': 'Alphabet Inc.', 'sector': 'Technology', 'market_cap': 'Large'}
-        ])
-        
-        # 模拟技术分析结果
-        if hasattr(system, 'technical_manager') and system.technical_manager:
-            system.technical_manager.all_signals = {
-                'equities': {
-                    'AAPL': {'signal': 'BUY', 'strategy': 'momentum_breakout', 'confidence': 0.8, 'recommendation': '建议一周内买入'},
-                    'MSFT': {'signal': 'WATCH', 'strategy': 'mean_reversion', 'confidence': 0.6, 'recommendation': '建议观望，一周内买入'}
-                },
-                'bonds': {
-                    'TLT': {'signal': 'WATCH', 'strategy': 'technical_watch', 'confidence': 0.5, 'recommendation': '建议观望，一周内买入'}
-                }
-            }
-        
-        # 生成投资组合
-        investment_amount = 100000
-        investment_horizon = "中期 (3-7年)"
-        risk_profile = "平衡"
-        
-        portfolio = system.generate_portfolio_recommendation(
-            investment_amount, investment_horizon, risk_profile
-        )
-        
-        if portfolio:
-            print("  ✅ 投资组合生成成功")
-            print(f"    总投资金额: ${portfolio['total_amount']:,.0f}")
-            print(f"    资产类别数量: {len(portfolio['assets'])}")
-            
-            # 检查技术分析建议
-            if 'technical_signals' in portfolio:
-                print(f"    技术分析建议: {len(portfolio['technical_signals'])} 个资产类别")
-                for asset_class, signals in portfolio['technical_signals'].items():
-                    print(f"      {asset_class}: {len(signals)} 个建议")
-            else:
-                print("    ⚠️ 投资组合中缺少技术分析建议")
-            
-            # 检查具体标的
-            for asset_class, assets in portfolio['assets'].items():
-                if assets:
-                    print(f"    {asset_class}: {len(assets)} 个标的")
-                    for asset in assets[:2]:  # 显示前2个
-                        print(f"      {asset.get('ticker', 'N/A')}: ${asset.get('amount', 0):,.2f}")
-            
-            return True
-        else:
-            print("  ❌ 投资组合生成失败")
-            return False
-        
-    except Exception as e:
-        print(f"  ❌ 投资组合生成测试失败: {e}")
-        return False
+    }
+    
+    # 修改返回的DataFrame和报告，不影响后续调用
+    top = manager.get_top_signals(3)
+    assert top['ticker'].tolist() == ['AAPL', 'MSFT']
+    assert {'stop_loss', 'reason'} <= set(top.columns)
+    top['extra'] = 1
+    assert 'extra' not in manager.get_top_signals(3).columns
+    report = manager.generate_comprehensive_report()
+    report['signals_summary'].clear()
+    assert 'equities' in manager.generate_comprehensive_report()['signals_summary']
+    
+    # 按资产类别写入信号后缓存失效
+    manager.all_signals['golds'] = {'GLD': {'signal': 'SELL', 'strength': 0.9}}
+    assert manager.get_top_signals(3)['ticker'].tolist() == ['GLD', 'AAPL', 'MSFT']
+    assert 'golds' in manager.generate_comprehensive_report()['asset_class_signals']
+    
+    # 原地修改单个信号后调用 invalidate_caches，缓存重新计算
+    assert manager.signals_df.set_index('ticker').loc['AAPL', 'signal'] == 'BUY'
+    manager.all_signals['equities']['AAPL']['signal'] = 'SELL'
+    manager.invalidate_caches()
+    assert manager.signals_df.set_index('ticker').loc['AAPL', 'signal'] == 'SELL'
+    assert manager.generate_comprehensive_report()['asset_class_signals']['equities']['signal_distribution'] == {'SELL': 1, 'HOLD': 1}
+    
+    print("  ✅ 技术信号缓存测试通过")
+
+def test_portfolio_generation(fresh_portfolio_system):
+    """测试投资组合生成（会改写系统状态，使用单独创建的系统实例）"""
+    print("💼 测试投资组合生成...")
+    system = fresh_portfolio_system
+    
+    # 模拟资产配置
+    system.asset_allocation = {
+        'equities': 40,
+        'bonds_mid': 20,
+        'bonds_long': 20,
+        'gold': 10,
+        'commodities': 10
+    }
+    
+    # 模拟基本面分析结果（浅拷贝，应用补充缺失列时不会改动模块常量）
+    system.equity_candidates = _EQUITY_FIXTURE.copy(deep=False)
+    
+    # 模拟技术分析结果
+    if hasattr(system, 'technical_manager') and system.technical_manager:
+        system.technical_manager.all_signals = _SIGNALS_FIXTURE
+    
+    # 生成投资组合
+    investment_amount = 100000
+    investment_horizon = "中期 (3-7年)"
+    risk_profile = "平衡"
+    
+    portfolio = system.generate_portfolio_recommendation(
+        investment_amount, investment_horizon, risk_profile
+    )
+    
+    assert portfolio, "投资组合生成失败"
+    print("  ✅ 投资组合生成成功")
+    print(f"    总投资金额: ${portfolio['total_amount']:,.0f}")
+    print(f"    资产类别数量: {len(portfolio['assets'])}")
+    
+    # 检查技术分析建议
+    assert 'technical_signals' in portfolio, "投资组合中缺少技术分析建议"
+    print(f"    技术分析建议: {len(portfolio['technical_signals'])} 个资产类别")
+    for asset_class, signals in portfolio['technical_signals'].items():
+        print(f"      {asset_class}: {len(signals)} 个建议")
+    
+    # 检查具体标的
+    for asset_class, assets in portfolio['assets'].items():
+        if assets:
+            print(f"    {asset_class}: {len(assets)} 个标的")
+            for asset in assets[:2]:  # 显示前2个
+                print(f"      {asset.get('ticker', 'N/A')}: ${asset.get('amount', 0):,.2f}")
 
 def main():
     """主测试函数"""
@@ -190,15 +187,22 @@ def main():
     print("=" * 60)
     
     # 测试基本面分析
-    fundamental_ok = test_fundamental_analysis()
+    manager = create_shared("基本面分析管理器", new_fundamental_manager)
+    fundamental_ok = manager is not None and run_test(test_fundamental_analysis, manager)
     print()
     
     # 测试技术分析
-    technical_ok = test_technical_analysis()
+    manager = create_shared("技术分析管理器", new_technical_manager)
+    technical_ok = manager is not None and run_test(test_technical_analysis, manager)
+    print()
+    
+    # 测试技术信号缓存
+    cache_ok = run_test(test_signal_caches)
     print()
     
     # 测试投资组合生成
-    portfolio_ok = test_portfolio_generation()
+    system = create_shared("投资组合系统", new_portfolio_system)
+    portfolio_ok = system is not None and run_test(test_portfolio_generation, system)
     print()
     
     # 总结
@@ -206,9 +210,10 @@ def main():
     print("📊 测试结果总结:")
     print(f"  基本面分析: {'✅ 通过' if fundamental_ok else '❌ 失败'}")
     print(f"  技术分析: {'✅ 通过' if technical_ok else '❌ 失败'}")
+    print(f"  技术信号缓存: {'✅ 通过' if cache_ok else '❌ 失败'}")
     print(f"  投资组合生成: {'✅ 通过' if portfolio_ok else '❌ 失败'}")
     
-    if all([fundamental_ok, technical_ok, portfolio_ok]):
+    if all([fundamental_ok, technical_ok, cache_ok, portfolio_ok]):
         print("\n🎉 所有测试通过！系统修复完成！")
         print("\n✅ 已解决的问题:")
         print("  - P1: 技术分析现在能生成交易信号")
@@ -218,7 +223,7 @@ def main():
     else:
         print("\n⚠️ 部分测试失败，需要进一步检查")
     
-    return all([fundamental_ok, technical_ok, portfolio_ok])
+    return all([fundamental_ok, technical_ok, cache_ok, portfolio_ok])
 
 if __name__ == "__main__":
     success = main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试黄金斐波那契回撤策略
+向量化实现与原逐个标的判断的实现在合成指标上结果一致
+"""
+
+import sys
+import os
+import pandas as pd
+
+# 添加项目路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from testing_support import run_test
+
+def _reference_fibonacci_strategy(indicators):
+    """原逐个标的判断的斐波那契回撤策略，作为向量化实现的对照"""
+    signals = {}
+
+    for ticker, ind in indicators.items():
+        if len(ind['close']) < 50:
+            continue
+
+        current_price = ind['close'].iloc[-1]
+        fib_levels = ind.get('fib_levels', {})
+        rsi = ind['rsi'].iloc[-1]
+        atr = ind['atr'].iloc[-1]
+
+        if not fib_levels:
+            continue
+
+        fib_382 = fib_levels.get('0.382', 0)
+        fib_618 = fib_levels.get('0.618', 0)
+        fib_786 = fib_levels.get('0.786', 0)
+
+        support_buy = (abs(current_price - fib_382) / current_price < 0.02 or
+                      abs(current_price - fib_618) / current_price < 0.02) and rsi < 40
+        resistance_sell = (abs(current_price - fib_786) / current_price < 0.02) and rsi > 60
+
+        if support_buy:
+            signals[ticker] = {
+                'strategy': 'fibonacci_support',
+                'signal': 'BUY',
+                'strength': 1,
+                'price': current_price,
+                'stop_loss': current_price - 1.5 * atr,
+                'target': current_price + 2 * atr,
+                'confidence': 0.6,
+                'reason': '斐波那契支撑位，RSI超卖'
+            }
+        elif resistance_sell:
+            signals[ticker] = {
+                'strategy': 'fibonacci_resistance',
+                'signal': 'SELL',
+                'strength': 1,
+                'price': current_price,
+                'stop_loss': current_price + 1.5 * atr,
+                'target': current_price - 2 * atr,
+                'confidence': 0.6,
+                'reason': '斐波那契阻力位，RSI超买'
+            }
+
+    return signals
+
+def _synthetic_indicators(price, rsi, fib_levels=None, length=60, atr=2.0):
+    """构造单个标的的合成指标：收盘价、RSI、ATR 序列的最后一个值分别为给定值"""
+    ind = {
+        'close': pd.Series([price] * length, dtype=float),
+        'rsi': pd.Series([rsi] * length, dtype=float),
+        'atr': pd.Series([atr] * length, dtype=float)
+    }
+    if fib_levels is not None:
+        ind['fib_levels'] = fib_levels
+    return ind
+
+def _fib_levels(near):
+    """远离价格100的斐波那契回撤位，near 中给出的水平替换为指定值"""
+    levels = {'0.0': 150.0, '0.236': 140.0, '0.382': 130.0, '0.5': 125.0,
+              '0.618': 120.0, '0.786': 115.0, '1.0': 50.0}
+    levels.update(near)
+    return levels
+
+def test_fibonacci_strategy():
+    """测试斐波那契回撤策略：支撑/阻力判断、两者同时满足、缺少回撤位、数据不足"""
+    print("🔍 测试黄金斐波那契回撤策略...")
+    from technical_analysis.golds.gold_technical_strategy import GoldTechnicalStrategy
+
+    indicators = {
+        # 0.382 / 0.618 支撑位附近且RSI超卖 -> 买入
+        'SUPPORT_382': _synthetic_indicators(100.0, 30, _fib_levels({'0.382': 101.0})),
+        'SUPPORT_618': _synthetic_indicators(100.0, 35, _fib_levels({'0.618': 99.5})),
+        # 0.786 阻力位附近且RSI超买 -> 卖出
+        'RESIST_786': _synthetic_indicators(100.0, 70, _fib_levels({'0.786': 100.5})),
+        # 同时位于支撑位和阻力位附近：RSI超卖时买入（支撑优先），RSI超买时卖出
+        'BOTH_LOW_RSI': _synthetic_indicators(100.0, 30, _fib_levels({'0.382': 100.5, '0.786': 99.5})),
+        'BOTH_HIGH_RSI': _synthetic_indicators(100.0, 70, _fib_levels({'0.382': 100.5, '0.786': 99.5})),
+        # 位于回撤位附近但RSI中性 -> 无信号
+        'NEUTRAL_RSI': _synthetic_indicators(100.0, 50, _fib_levels({'0.382': 100.5, '0.786': 99.5})),
+        # 缺少回撤位（无该键 / 空字典）-> 跳过
+        'NO_FIB_KEY': _synthetic_indicators(100.0, 30),
+        'EMPTY_FIB': _synthetic_indicators(100.0, 30, {}),
+        # 只有部分回撤位，缺少的水平按0处理
+        'PARTIAL_FIB': _synthetic_indicators(100.0, 70, {'0.786': 101.0}),
+        # 数据不足50天 -> 跳过，即使满足支撑条件
+        'SHORT_HISTORY': _synthetic_indicators(100.0, 30, _fib_levels({'0.382': 100.0}), length=49)
+    }
+
+    signals = GoldTechnicalStrategy().fibonacci_strategy(indicators)
+
+    # 与原实现逐项一致
+    assert signals == _reference_fibonacci_strategy(indicators)
+    assert {ticker: signal['signal'] for ticker, signal in signals.items()} == {
+        'SUPPORT_382': 'BUY',
+        'SUPPORT_618': 'BUY',
+        'RESIST_786': 'SELL',
+        'BOTH_LOW_RSI': 'BUY',
+        'BOTH_HIGH_RSI': 'SELL',
+        'PARTIAL_FIB': 'SELL'
+    }
+    assert signals['BOTH_LOW_RSI']['strategy'] == 'fibonacci_support'
+    assert signals['SUPPORT_382']['stop_loss'] == 100.0 - 1.5 * 2.0
+
+    # 所有标的都被跳过时返回空字典
+    assert GoldTechnicalStrategy().fibonacci_strategy({'SHORT_HISTORY': indicators['SHORT_HISTORY']}) == {}
+
+    print("✅ 斐波那契回撤策略测试通过")
+
+if __name__ == "__main__":
+    success = run_test(test_fibonacci_strategy)
+    sys.exit(0 if success else 1)
@@ -5,87 +5,68 @@
 
 import sys
 import os
+import importlib
 
 # 添加项目路径
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = current_dir
-sys.path.insert(0, project_root)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
-def test_imports():
-    """测试所有必要的导入"""
-    try:
-        import streamlit as st
-        print("✅ Streamlit 导入成功")
-        
-        import pandas as pd
-        print("✅ Pandas 导入成功")
-        
-        import numpy as np
-        print("✅ Numpy 导入成功")
-        
-        import plotly.graph_objects as go
-        print("✅ Plotly 导入成功")
-        
-        import plotly.express as px
-        print("✅ Plotly Express 导入成功")
-        
-        return True
-    except ImportError as e:
-        print(f"❌ 导入失败: {e}")
-        return False
+from testing_support import new_portfolio_system, run_test
+
+def test_imports(streamlit_module):
+    """测试所有必要的导入（streamlit 由调用方导入后传入，pytest 下未安装时跳过）"""
+    assert streamlit_module.__name__ == 'streamlit'
+    print("✅ Streamlit 导入成功")
+    
+    import pandas as pd
+    print("✅ Pandas 导入成功")
+    
+    import numpy as np
+    print("✅ Numpy 导入成功")
+    
+    import plotly.graph_objects as go
+    print("✅ Plotly 导入成功")
+    
+    import plotly.express as px
+    print("✅ Plotly Express 导入成功")
 
-def test_app_file():
+def test_app_file(portfolio_system):
     """测试主应用文件"""
-    try:
-        # 尝试编译应用文件
-        import py_compile
-        py_compile.compile('interactive_portfolio_app.py')
-        print("✅ 应用文件编译成功")
-        
-        # 尝试导入主要类
-        from interactive_portfolio_app import CompletePortfolioSystem
-        print("✅ 主要类导入成功")
-        
-        # 尝试创建实例
-        system = CompletePortfolioSystem()
-        print("✅ 系统实例创建成功")
-        
-        return True
-    except Exception as e:
-        print(f"❌ 应用文件测试失败: {e}")
-        return False
+    # 只做语法检查（不生成/写入 .pyc）
+    import ast
+    app_path = os.path.join(project_root, 'interactive_portfolio_app.py')
+    with open(app_path, 'r', encoding='utf-8') as f:
+        ast.parse(f.read(), filename=app_path)
+    print("✅ 应用文件语法检查通过")
+    
+    # 尝试导入主要类
+    from interactive_portfolio_app import CompletePortfolioSystem
+    print("✅ 主要类导入成功")
+    
+    # 检查共享的系统实例
+    assert isinstance(portfolio_system, CompletePortfolioSystem), "系统实例类型不正确"
+    print("✅ 系统实例创建成功")
 
-def test_display_functions():
-    """测试显示函数"""
-    try:
-        from interactive_portfolio_app import display_fundamental_results, display_technical_signals
-        
-        # 创建模拟数据
-        class MockSystem:
-            def __init__(self):
-                self.equity_candidates = None
-                self.bond_candidates = None
-                self.commodity_candidates = None
-                self.gold_candidates = None
-        
-        system = MockSystem()
-        
-        # 测试函数调用（不实际显示）
-        print("✅ 显示函数导入成功")
-        return True
-    except Exception as e:
-        print(f"❌ 显示函数测试失败: {e}")
-        return False
+def test_display_functions(streamlit_module):
+    """测试显示函数（依赖streamlit）"""
+    from interactive_portfolio_app import display_fundamental_results, display_technical_signals
+    
+    # 测试函数可调用（不实际显示）
+    assert callable(display_fundamental_results) and callable(display_technical_signals)
+    print("✅ 显示函数导入成功")
 
 def main():
     """主测试函数"""
     print("🚀 开始测试应用改进功能...")
     print("=" * 50)
     
+    # 脚本方式运行时在此导入streamlit、创建系统实例（pytest 下由 conftest.py 的会话级夹具提供）
     tests = [
-        ("导入测试", test_imports),
-        ("应用文件测试", test_app_file),
-        ("显示函数测试", test_display_functions),
+        ("导入测试", lambda: run_test(test_imports, importlib.import_module("streamlit"))),
+        ("应用文件测试", lambda: run_test(test_app_file, new_portfolio_system())),
+        ("显示函数测试", lambda: run_test(test_display_functions, importlib.import_module("streamlit"))),
     ]
     
     results = []
@@ -0,0 +1,45 @@
+# testing_support.py
+"""
+测试共用对象的创建函数
+conftest.py 的会话级夹具和各测试脚本的 main() 都通过这里创建管理器和投资组合系统
+"""
+
+import sys
+import os
+
+# 添加项目路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+def new_fundamental_manager():
+    """创建基本面分析管理器"""
+    from fundamental_analysis.fundamental_manager import FundamentalAnalysisManager
+    return FundamentalAnalysisManager()
+
+def new_technical_manager():
+    """创建技术分析管理器"""
+    from technical_analysis.technical_signals import TechnicalAnalysisManager
+    return TechnicalAnalysisManager()
+
+def new_portfolio_system():
+    """创建完整投资组合系统（依赖streamlit）"""
+    from interactive_portfolio_app import CompletePortfolioSystem
+    return CompletePortfolioSystem()
+
+def create_shared(label, factory):
+    """脚本方式运行时创建测试共用的对象（pytest 下由 conftest.py 的会话级夹具提供），失败返回None"""
+    try:
+        return factory()
+    except Exception as e:
+        print(f"  ❌ {label}创建失败: {e}")
+        return None
+
+def run_test(test_func, *args):
+    """脚本方式运行基于 assert 的测试：通过返回True，断言失败或出现异常时打印原因并返回False"""
+    try:
+        test_func(*args)
+        return True
+    except Exception as e:
+        print(f"  ❌ {test_func.__name__} 失败: {e!r}")
+        return False
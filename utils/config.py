@@ -4,77 +4,115 @@
 管理各种参数和阈值
 """
 
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+
+class _ConfigSection(Mapping):
+    """配置段基类：属性访问为主，同时作为只读映射兼容原有的 CONFIG["KEY"]、in、迭代和 dict(CONFIG) 写法"""
+
+    def _field_names(self):
+        return [f.name for f in fields(self)]
+
+    def __getitem__(self, key):
+        # 只接受配置字段名，方法名等其他属性按不存在处理
+        if key not in self._field_names():
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self._field_names())
+
+    def __len__(self):
+        return len(fields(self))
+
+    def __contains__(self, key):
+        return key in self._field_names()
+
 # 股票筛选参数
-STOCK_SCREENING_CONFIG = {
+@dataclass(frozen=True)
+class StockScreeningConfig(_ConfigSection):
     # 市值筛选
-    "MIN_MARKET_CAP": 10e9,  # 最小市值：10亿美元
-    
+    MIN_MARKET_CAP: float = 10e9  # 最小市值：10亿美元
+
     # 财务稳定性筛选
-    "MIN_ROE": 0,  # 最小ROE：0%
-    "MIN_GROSS_MARGIN": 0,  # 最小毛利率：0%
-    "MIN_FREE_CASHFLOW": 0,  # 最小自由现金流：0
-    "MAX_DEBT_TO_EQUITY": 2,  # 最大负债率：200%
-    "MIN_PE": 0,  # 最小PE：0
-    "MAX_PE": 100,  # 最大PE：100
-    "MIN_PB": 0,  # 最小PB：0
-    "MAX_PB": 20,  # 最大PB：20
-    
+    MIN_ROE: float = 0  # 最小ROE：0%
+    MIN_GROSS_MARGIN: float = 0  # 最小毛利率：0%
+    MIN_FREE_CASHFLOW: float = 0  # 最小自由现金流：0
+    MAX_DEBT_TO_EQUITY: float = 2  # 最大负债率：200%
+    MIN_PE: float = 0  # 最小PE：0
+    MAX_PE: float = 100  # 最大PE：100
+    MIN_PB: float = 0  # 最小PB：0
+    MAX_PB: float = 20  # 最大PB：20
+
     # 动量计算
-    "MOMENTUM_PERIOD": 180,  # 动量计算周期：180天
-    "MIN_PRICE_DATA_DAYS": 30,  # 最小价格数据天数：30天
-    
+    MOMENTUM_PERIOD: int = 180  # 动量计算周期：180天
+    MIN_PRICE_DATA_DAYS: int = 30  # 最小价格数据天数：30天
+
     # 因子计算
-    "PE_NORMALIZATION": 20,  # PE标准化基准：20
-    "PB_NORMALIZATION": 5,   # PB标准化基准：5
-    "MOMENTUM_MIN": -0.5,    # 动量最小值：-50%
-    "MOMENTUM_MAX": 1.0,     # 动量最大值：100%
-    
+    PE_NORMALIZATION: float = 20  # PE标准化基准：20
+    PB_NORMALIZATION: float = 5   # PB标准化基准：5
+    MOMENTUM_MIN: float = -0.5    # 动量最小值：-50%
+    MOMENTUM_MAX: float = 1.0     # 动量最大值：100%
+
     # 最终选择
-    "TARGET_STOCK_COUNT": 40,  # 目标股票数量：40只
-    "BATCH_SIZE": 20,  # 批量下载大小：20只
-    "REQUEST_DELAY": 0.5,  # 请求延迟：0.5秒
-}
+    TARGET_STOCK_COUNT: int = 40  # 目标股票数量：40只
+    BATCH_SIZE: int = 20  # 批量下载大小：20只
+    REQUEST_DELAY: float = 0.5  # 请求延迟：0.5秒
+
+STOCK_SCREENING_CONFIG = StockScreeningConfig()
 
 # 宏观分析参数
-MACRO_ANALYSIS_CONFIG = {
-    "DATA_PERIOD": 90,  # 数据获取周期：90天
-    "Z_SCORE_SCALE": 1.5,  # Z-score调整系数
-    "MAX_ADJUSTMENT": 3,  # 最大调整幅度：3%
-}
+@dataclass(frozen=True)
+class MacroAnalysisConfig(_ConfigSection):
+    DATA_PERIOD: int = 90  # 数据获取周期：90天
+    Z_SCORE_SCALE: float = 1.5  # Z-score调整系数
+    MAX_ADJUSTMENT: float = 3  # 最大调整幅度：3%
+
+MACRO_ANALYSIS_CONFIG = MacroAnalysisConfig()
 
 # 资产配置基准权重
-BASELINE_WEIGHTS = {
-    "equities": 30,      # 股票类资产
-    "bonds_mid": 15,     # 中期债券
-    "bonds_long": 40,    # 长期债券
-    "gold": 7.5,         # 黄金资产
-    "commodities": 7.5   # 大宗商品
-}
+@dataclass(frozen=True)
+class BaselineWeights(_ConfigSection):
+    equities: float = 30      # 股票类资产
+    bonds_mid: float = 15     # 中期债券
+    bonds_long: float = 40    # 长期债券
+    gold: float = 7.5         # 黄金资产
+    commodities: float = 7.5  # 大宗商品
+
+BASELINE_WEIGHTS = BaselineWeights()
 
 # 数据源配置
-DATA_SOURCES = {
-    "FRED_API_KEY": "FRED_API_KEY",  # 需要在.env文件中设置
-    "YAHOO_FINANCE": "yfinance",
-    "SLICKCHARTS": "https://www.slickcharts.com"
-}
+@dataclass(frozen=True)
+class DataSources(_ConfigSection):
+    FRED_API_KEY: str = "FRED_API_KEY"  # 需要在.env文件中设置
+    YAHOO_FINANCE: str = "yfinance"
+    SLICKCHARTS: str = "https://www.slickcharts.com"
+
+DATA_SOURCES = DataSources()
 
 # 文件路径配置
-FILE_PATHS = {
-    "EQUITY_LIST": "fundamental_analysis/equities/tickers/us_equity_top517.txt",
-    "OUTPUT_DIR": "fundamental_analysis/equities/tickers",
-    "REPORT_DIR": "reports"
-}
+@dataclass(frozen=True)
+class FilePaths(_ConfigSection):
+    EQUITY_LIST: str = "fundamental_analysis/equities/tickers/us_equity_top517.txt"
+    OUTPUT_DIR: str = "fundamental_analysis/equities/tickers"
+    REPORT_DIR: str = "reports"
+
+FILE_PATHS = FilePaths()
 
 # 日志配置
-LOGGING_CONFIG = {
-    "LOG_LEVEL": "INFO",
-    "LOG_FORMAT": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    "LOG_FILE": "tiger_all_weather.log"
-}
+@dataclass(frozen=True)
+class LoggingConfig(_ConfigSection):
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    LOG_FILE: str = "tiger_all_weather.log"
+
+LOGGING_CONFIG = LoggingConfig()
 
 # 性能配置
-PERFORMANCE_CONFIG = {
-    "CACHE_TTL": 3600,  # 缓存时间：1小时
-    "MAX_RETRIES": 3,   # 最大重试次数：3次
-    "TIMEOUT": 30,      # 超时时间：30秒
-}
+@dataclass(frozen=True)
+class PerformanceConfig(_ConfigSection):
+    CACHE_TTL: int = 3600  # 缓存时间：1小时
+    MAX_RETRIES: int = 3   # 最大重试次数：3次
+    TIMEOUT: int = 30      # 超时时间：30秒
+
+PERFORMANCE_CONFIG = PerformanceConfig()